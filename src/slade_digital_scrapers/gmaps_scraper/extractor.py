@@ -3,6 +3,11 @@
 import json
 import re
 
+APP_INITIALIZATION_STATE_RE = re.compile(
+    r";window\.APP_INITIALIZATION_STATE\s*=\s*(.*?);window\.APP_FLAGS", re.DOTALL
+)
+NON_DIGIT_RE = re.compile(r"\D")
+
 def safe_get(data, *keys):
     """
     Safely retrieves nested data from a dictionary or list using a sequence of keys/indices.
@@ -36,11 +41,7 @@ def extract_initial_json(html_content):
     Extracts the JSON string assigned to window.APP_INITIALIZATION_STATE from HTML content.
     """
     try:
-        match = re.search(
-            r";window\.APP_INITIALIZATION_STATE\s*=\s*(.*?);window\.APP_FLAGS",
-            html_content,
-            re.DOTALL,
-        )
+        match = APP_INITIALIZATION_STATE_RE.search(html_content)
         if match:
             json_str = match.group(1)
             if json_str.strip().startswith(('[', '{')):
@@ -72,58 +73,7 @@ def parse_json_data(json_str):
             and isinstance(initial_data[3], list)
             and len(initial_data[3]) > 6
         ):
-            data_blob_or_str = initial_data[3][6]
-
-            # Case 1: It's already the list we expect (older format?)
-            if isinstance(data_blob_or_str, list):
-                print("Found expected list structure directly at initial_data[3][6].")
-                return data_blob_or_str
-
-            # Case 2: It's the string containing the actual JSON
-            elif isinstance(data_blob_or_str, str) and data_blob_or_str.startswith(
-                ")]}'\n"
-            ):
-                print(
-                    "Found string at initial_data[3][6], attempting to parse inner JSON."
-                )
-                try:
-                    json_str_inner = data_blob_or_str.split(")]}'\n", 1)[1]
-                    actual_data = json.loads(json_str_inner)
-
-                    # Check if the parsed inner data is a list
-                    # and has the expected sub-structure at index 6
-                    if isinstance(actual_data, list) and len(actual_data) > 6:
-                        potential_data_blob = safe_get(actual_data, 6)
-                        if isinstance(potential_data_blob, list):
-                            print("Returning data blob found at actual_data[6].")
-                            return potential_data_blob  # This is the main data structure
-                        else:
-                            print(
-                                "Data at actual_data[6] is not a list, "
-                                f"but {type(potential_data_blob)}."
-                            )
-                            return None  # Structure mismatch within inner data
-                    else:
-                        print(
-                            "Parsed inner JSON is not a list or too short (len <= 6), "
-                            f"type: {type(actual_data)}."
-                        )
-                        return None  # Inner JSON structure not as expected
-
-                except json.JSONDecodeError as e_inner:
-                    print(f"Error decoding inner JSON string: {e_inner}")
-                    return None
-                except Exception as e_inner_general:  # noqa: BLE001  # pylint: disable=broad-except
-                    print(f"Unexpected error processing inner JSON string: {e_inner_general}")
-                    return None
-
-            # Case 3: Data at [3][6] is neither a list nor the expected string
-            else:
-                print(
-                    "Parsed JSON structure unexpected at [3][6]. Expected list "
-                    f"or prefixed JSON string, got {type(data_blob_or_str)}."
-                )
-                return None  # Unexpected structure at [3][6]
+            return parse_place_payload(initial_data[3][6])
 
         # Case 4: Initial path [3][6] itself wasn't valid
         else:
@@ -141,6 +91,63 @@ def parse_json_data(json_str):
         return None
 
 
+def parse_place_payload(data_blob_or_str):
+    """
+    Parses the place payload found at APP_INITIALIZATION_STATE[3][6].
+    Returns the main data blob (list) or None if the structure is unexpected.
+    """
+    # Case 1: It's already the list we expect (older format?)
+    if isinstance(data_blob_or_str, list):
+        print("Found expected list structure directly at initial_data[3][6].")
+        return data_blob_or_str
+
+    # Case 2: It's the string containing the actual JSON
+    elif isinstance(data_blob_or_str, str) and data_blob_or_str.startswith(
+        ")]}'\n"
+    ):
+        print(
+            "Found string at initial_data[3][6], attempting to parse inner JSON."
+        )
+        try:
+            json_str_inner = data_blob_or_str.split(")]}'\n", 1)[1]
+            actual_data = json.loads(json_str_inner)
+
+            # Check if the parsed inner data is a list
+            # and has the expected sub-structure at index 6
+            if isinstance(actual_data, list) and len(actual_data) > 6:
+                potential_data_blob = safe_get(actual_data, 6)
+                if isinstance(potential_data_blob, list):
+                    print("Returning data blob found at actual_data[6].")
+                    return potential_data_blob  # This is the main data structure
+                else:
+                    print(
+                        "Data at actual_data[6] is not a list, "
+                        f"but {type(potential_data_blob)}."
+                    )
+                    return None  # Structure mismatch within inner data
+            else:
+                print(
+                    "Parsed inner JSON is not a list or too short (len <= 6), "
+                    f"type: {type(actual_data)}."
+                )
+                return None  # Inner JSON structure not as expected
+
+        except json.JSONDecodeError as e_inner:
+            print(f"Error decoding inner JSON string: {e_inner}")
+            return None
+        except Exception as e_inner_general:  # noqa: BLE001  # pylint: disable=broad-except
+            print(f"Unexpected error processing inner JSON string: {e_inner_general}")
+            return None
+
+    # Case 3: Data at [3][6] is neither a list nor the expected string
+    else:
+        print(
+            "Parsed JSON structure unexpected at [3][6]. Expected list "
+            f"or prefixed JSON string, got {type(data_blob_or_str)}."
+        )
+        return None  # Unexpected structure at [3][6]
+
+
 # --- Field Extraction Functions (Indices relative to the data_blob returned by parse_json_data) ---
 def get_main_name(data):
     """Extracts the main name of the place."""
@@ -193,7 +200,7 @@ def _find_phone_recursively(data_structure):
            isinstance(data_structure[1], str):
             # Found the pattern, assume data_structure[1] is the phone number
             phone_number_str = data_structure[1]
-            standardized_number = re.sub(r'\D', '', phone_number_str)
+            standardized_number = NON_DIGIT_RE.sub('', phone_number_str)
             if standardized_number:
                 # print(f"Debug: Found phone via recursive search: {standardized_number}")
                 return standardized_number
@@ -259,6 +266,22 @@ def extract_place_data(html_content):
         print("Failed to parse JSON data or find expected structure.")
         return None
 
+    return extract_fields(data_blob)
+
+def extract_place_data_from_payload(payload):
+    """
+    Extract place data from the APP_INITIALIZATION_STATE[3][6] payload read
+    directly from a rendered page, skipping the HTML round-trip.
+    """
+    data_blob = parse_place_payload(payload)
+    if not data_blob:
+        print("Failed to parse place payload or find expected structure.")
+        return None
+
+    return extract_fields(data_blob)
+
+def extract_fields(data_blob):
+    """Build the place details dict from a parsed data blob."""
     # Now extract individual fields using the helper functions
     place_details = {
         "name": get_main_name(data_blob),
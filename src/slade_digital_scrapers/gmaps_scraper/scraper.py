@@ -1,20 +1,109 @@
 """Async Playwright workflow for gathering Google Maps place data."""
 
 import asyncio
+import contextlib
+import logging
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from http.cookies import Morsel
 from urllib.parse import urlencode
+import aiohttp
 from playwright.async_api import async_playwright
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 # Import the extraction functions from our helper module
 from . import extractor
 
+log = logging.getLogger(__name__)
+
 # --- Constants ---
 BASE_URL = "https://www.google.com/maps/search/"
 DEFAULT_TIMEOUT = 30000  # 30 seconds for navigation and selectors
 SCROLL_PAUSE_TIME = 1.5  # Pause between scrolls
-MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS = 5  # Stop after this many no-link scrolls
+MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS = 5  # Stop after this many scrolls without feed growth
+SCROLLS_PER_EVALUATE = 5  # Feed scrolls performed inside a single page.evaluate call
+DEFAULT_CONCURRENCY = 8  # Parallel pages used to scrape place details
+CONSENT_TIMEOUT = 5000  # Milliseconds to wait for a consent form button
+CONSENT_BUTTON_NAME = re.compile(r"Accept all")
+HTTP_FETCH_CONCURRENCY = 16  # Parallel HTTP requests used to fetch place pages
+HTTP_FETCH_TIMEOUT = 20  # Seconds allowed for a single place page fetch
+BROWSER_ARGS = [
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+]
+# Consent cookies left behind by a finished consent step, keyed by language. Later
+# scrapes in the same process preload them and skip the consent wait entirely.
+# Only these names are kept, so session cookies (NID, AEC, ...) stay per context.
+CONSENT_COOKIES = {}
+CONSENT_COOKIE_NAMES = frozenset({"SOCS", "CONSENT"})
+CONSENT_PAGE_MARKER = "consent.google"
+
+# Requests the extractor never needs; the feed layout still relies on stylesheets
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_URL_MARKERS = ("googletagmanager", "google-analytics", "doubleclick")
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/91.0.4472.124 Safari/537.36"
+)
+
+# HTML parsing is CPU-bound, so it runs in worker processes to keep the event loop free.
+# The pool is created by `start_parse_pool` (the API lifespan) or lazily on first use,
+# and replaced if a worker dies and breaks it.
+_PARSE_POOL = None
+_PARSE_POOL_WORKERS = None
+
+# Reads only the place payload (APP_INITIALIZATION_STATE[3][6]) from a rendered page,
+# which is far smaller than serializing the whole DOM with page.content().
+PLACE_PAYLOAD_JS = "() => window.APP_INITIALIZATION_STATE?.[3]?.[6] ?? null"
+
+# Scrolls the results feed and harvests place links inside the page, so a batch of
+# scrolls costs one CDP round-trip. Links already reported are remembered in
+# `window.__gmapsSeen`, so each call only returns new ones. `stalls` counts
+# consecutive scrolls that did not grow the feed and is carried across calls.
+SCROLL_AND_COLLECT_JS = """
+async ([feedSelector, pauseMs, maxScrolls, limit, maxStalls, stalls]) => {
+    const feed = document.querySelector(feedSelector);
+    const endMarker = "//span[contains(text(), \\"You've reached the end of the list.\\")]";
+    const seen = window.__gmapsSeen;
+    const fresh = [];
+    let lastHeight = feed.scrollHeight;
+    let done = false;
+    for (let i = 0; i < maxScrolls && !done; i++) {
+        feed.scrollTop = feed.scrollHeight;
+        await new Promise((resolve) => setTimeout(resolve, pauseMs));
+        feed.querySelectorAll('a[href*="/maps/place/"]').forEach((a) => {
+            if (!seen.has(a.href)) {
+                seen.add(a.href);
+                fresh.push(a.href);
+            }
+        });
+        if (limit && seen.size >= limit) {
+            break;
+        }
+        const newHeight = feed.scrollHeight;
+        if (newHeight === lastHeight) {
+            const atEnd = document.evaluate(
+                endMarker, document, null, XPathResult.BOOLEAN_TYPE, null
+            ).booleanValue;
+            stalls += 1;
+            done = atEnd || stalls >= maxStalls;
+        } else {
+            lastHeight = newHeight;
+            stalls = 0;
+        }
+    }
+    return { links: fresh, done, stalls };
+}
+"""
 
 # --- Helper Functions ---
+@lru_cache(maxsize=1024)
 def create_search_url(query, lang="en"):
     """Creates a Google Maps search URL."""
     params = {'q': query, 'hl': lang}
@@ -22,8 +111,168 @@ def create_search_url(query, lang="en"):
     # For simplicity, starting with basic query search
     return BASE_URL + "?" + urlencode(params)
 
+def start_parse_pool(max_workers=None):
+    """
+    Create the process pool used for HTML parsing.
+
+    Args:
+        max_workers (int, optional): Worker processes; defaults to the CPU count.
+            Size it to the CPUs available to this process (e.g. divided by the
+            number of uvicorn workers).
+
+    Returns:
+        ProcessPoolExecutor: The new pool; call `shutdown_parse_pool` when done.
+    """
+    global _PARSE_POOL, _PARSE_POOL_WORKERS  # pylint: disable=global-statement
+    shutdown_parse_pool()
+    _PARSE_POOL_WORKERS = max_workers
+    # "spawn" avoids forking a process that is running Playwright and event-loop threads
+    _PARSE_POOL = ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    return _PARSE_POOL
+
+def shutdown_parse_pool():
+    """Shut the parse pool down, if one is running."""
+    global _PARSE_POOL  # pylint: disable=global-statement
+    pool, _PARSE_POOL = _PARSE_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+async def _run_in_parse_pool(func, payload):
+    """
+    Run an extractor function in the parse pool.
+
+    A pool broken by a dead worker (e.g. OOM-killed) is replaced and the call
+    retried once, so one crash does not break every later scrape.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _PARSE_POOL or start_parse_pool(_PARSE_POOL_WORKERS)
+    try:
+        return await loop.run_in_executor(pool, func, payload)
+    except BrokenProcessPool:
+        if pool is _PARSE_POOL:
+            # Only the first caller to notice replaces it
+            log.warning("Parse pool broke; starting a new one.")
+            start_parse_pool(_PARSE_POOL_WORKERS)
+        return await loop.run_in_executor(_PARSE_POOL, func, payload)
+
+def _cookie_jar_from_browser(cookies):
+    """
+    Build an aiohttp cookie jar from cookies exported by a Playwright context.
+
+    Values are sent exactly as the browser holds them: by default aiohttp quotes
+    any value containing `=`, which corrupts cookies such as NID ("511=...").
+    """
+    jar = aiohttp.CookieJar(quote_cookie=False)
+    for cookie in cookies:
+        morsel = Morsel()
+        morsel.set(cookie["name"], cookie["value"], cookie["value"])
+        morsel["domain"] = cookie.get("domain", "")
+        morsel["path"] = cookie.get("path", "/")
+        jar.update_cookies({cookie["name"]: morsel})
+    return jar
+
+async def _fetch_and_extract(session, semaphore, link, results, fallback_q):
+    """
+    Fetch a place page over plain HTTP and extract its data.
+
+    Links that cannot be extracted from the raw response (consent/challenge pages,
+    non-200 responses, network, decoding or parsing errors) are queued for the
+    Playwright fallback; nothing is raised, so one link never fails the batch.
+    """
+    html_content = None
+    try:
+        async with semaphore:
+            async with session.get(link) as response:
+                if response.status == 200:
+                    html_content = await response.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        log.warning("HTTP fetch failed for %s: %s", link, e)
+    except Exception as e:  # noqa: BLE001  # pylint: disable=broad-except
+        log.warning("Error reading %s: %s", link, e)
+
+    place_data = None
+    if html_content:
+        try:
+            place_data = await _run_in_parse_pool(extractor.extract_place_data, html_content)
+        except Exception as e:  # noqa: BLE001  # pylint: disable=broad-except
+            log.warning("Error parsing %s: %s", link, e)
+    if place_data:
+        place_data['link'] = link # Add the source link
+        results.append(place_data)
+    else:
+        fallback_q.put_nowait(link)
+
+async def _scrape_place_worker(context, links_q, results):
+    """Drain place links from the queue on a dedicated page, appending extracted data."""
+    page = await context.new_page()
+    try:
+        while not links_q.empty():
+            link = links_q.get_nowait()
+            log.debug("Processing link: %s", link)
+            try:
+                await page.goto(link, wait_until='domcontentloaded')
+                payload = await page.evaluate(PLACE_PAYLOAD_JS)
+                place_data = (
+                    await _run_in_parse_pool(extractor.extract_place_data_from_payload, payload)
+                    if payload is not None
+                    else None
+                )
+                if not place_data:
+                    # Fall back to parsing the full serialized DOM
+                    html_content = await page.content()
+                    place_data = await _run_in_parse_pool(
+                        extractor.extract_place_data, html_content
+                    )
+
+                if place_data:
+                    place_data['link'] = link # Add the source link
+                    results.append(place_data)
+                else:
+                    log.warning("Failed to extract data for: %s", link)
+            except PlaywrightTimeoutError:
+                log.warning("Timeout navigating to or processing: %s", link)
+            except Exception as e:  # noqa: BLE001  # pylint: disable=broad-except
+                log.warning("Error processing %s: %s", link, e)
+    finally:
+        await page.close()
+
+async def _block_heavy_resources(route, request):
+    """Abort images, media, fonts and trackers; let everything else through."""
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        marker in request.url for marker in BLOCKED_URL_MARKERS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def launch_shared_browser(headless=True):
+    """
+    Start Playwright and launch a Chromium browser meant to be reused across scrapes.
+
+    Returns:
+        tuple: `(playwright, browser)`; the caller closes the browser and stops
+               Playwright when done.
+    """
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch(headless=headless, args=BROWSER_ARGS)
+    except BaseException:
+        await playwright.stop()
+        raise
+    return playwright, browser
+
 # --- Main Scraping Logic ---
-async def scrape_google_maps(query, max_places=None, lang="en", headless=True):
+async def scrape_google_maps(
+    query,
+    max_places=None,
+    lang="en",
+    headless=True,
+    concurrency=DEFAULT_CONCURRENCY,
+    browser=None,
+):
     """
     Scrapes Google Maps for places based on a query.
 
@@ -32,6 +281,11 @@ async def scrape_google_maps(query, max_places=None, lang="en", headless=True):
         max_places (int, optional): Max num of places to scrape. Defaults to None.
         lang (str, optional): Language code for Google Maps (e.g., 'en', 'es'). Defaults to "en".
         headless (bool, optional): Whether to run the browser in headless mode. Defaults to True.
+        concurrency (int, optional): Number of pages scraping place details in parallel.
+            Defaults to DEFAULT_CONCURRENCY.
+        browser (Browser, optional): Already running browser to scrape in (see
+            `launch_shared_browser`). Only a fresh context is created and closed; when
+            None, a browser is launched for this call and `headless` applies.
 
     Returns:
         list: A list of dictionaries, each containing details for a scraped place.
@@ -39,32 +293,24 @@ async def scrape_google_maps(query, max_places=None, lang="en", headless=True):
     """
     results = []
     place_links = set()
-    scroll_attempts_no_new = 0
-    browser = None
 
-    async with async_playwright() as p:
+    # Closes the context, then the browser and Playwright if launched here
+    async with contextlib.AsyncExitStack() as cleanup:
         try:
-            browser = await p.chromium.launch(
-                headless=headless,
-                args=[
-                    "--disable-dev-shm-usage",
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                ],
-            )
+            if browser is None:
+                p = await cleanup.enter_async_context(async_playwright())
+                browser = await p.chromium.launch(headless=headless, args=BROWSER_ARGS)
+                cleanup.push_async_callback(browser.close)
             context = await browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/91.0.4472.124 Safari/537.36"
-                ),
+                user_agent=USER_AGENT,
                 java_script_enabled=True,
                 accept_downloads=False,
                 locale=lang,
             )
+            cleanup.push_async_callback(context.close)
+            await context.route("**/*", _block_heavy_resources)
             page = await context.new_page()
             if not page:
-                await browser.close()
                 raise Exception(  # noqa: TRY002  # pylint: disable=broad-exception-raised
                     "Failed to create a new browser page "
                     "(context.new_page() returned None)."
@@ -72,100 +318,54 @@ async def scrape_google_maps(query, max_places=None, lang="en", headless=True):
             # Removed problematic: await page.set_default_timeout(DEFAULT_TIMEOUT)
             # Removed associated debug prints
 
+            consent_cookies = CONSENT_COOKIES.get(lang)
+            if consent_cookies:
+                await context.add_cookies(consent_cookies)
+
             search_url = create_search_url(query, lang)
-            print(f"Navigating to search URL: {search_url}")
+            log.info("Navigating to search URL: %s", search_url)
             await page.goto(search_url, wait_until="domcontentloaded")
             await asyncio.sleep(2)
 
             # --- Handle potential consent forms ---
-            # This is a common pattern, might need adjustment based on specific consent popups
-            try:
-                consent_button_xpath = (
-                    "//button[.//span[contains(text(), 'Accept all') "
-                    "or contains(text(), 'Reject all')]]"
-                )
-                # Additional consent input xpath (for input elements, not buttons)
-                consent_input_xpath = "/html/body/div/div[2]/div[1]/div[3]/form[2]/input[15]"
-                
-                consent_clicked = False
-                
-                # Method 1: Try to find input[type="submit"] with value="Accept all"
+            # The role locator matches both <button> and <input type="submit">
+            # variants of the consent form in a single query.
+            if consent_cookies is not None and CONSENT_PAGE_MARKER in page.url:
+                # The cached cookies expired or were rejected; accept the form again
+                log.info("Cached consent cookies were not accepted; redoing consent.")
+                CONSENT_COOKIES.pop(lang, None)
+                consent_cookies = None
+            if consent_cookies is not None:
+                log.debug("Reusing consent cookies from an earlier scrape.")
+            else:
+                remember_consent = False
                 try:
-                    accept_input_xpath = '//input[@type="submit" and @value="Accept all"]'
-                    await page.wait_for_selector(
-                        accept_input_xpath,
-                        state="visible",
-                        timeout=3000,
+                    await page.get_by_role("button", name=CONSENT_BUTTON_NAME).first.click(
+                        timeout=CONSENT_TIMEOUT
                     )
-                    accept_input = await page.query_selector(accept_input_xpath)
-                    if accept_input:
-                        print("Accepting consent form (input submit Accept all)...")
-                        await accept_input.click()
-                        consent_clicked = True
-                except PlaywrightTimeoutError:
-                    pass
-                
-                # Method 2: Try to find button with "Accept all" text (span inside button)
-                if not consent_clicked:
-                    try:
-                        await page.wait_for_selector(
-                            "//button[.//span[contains(text(), 'Accept all')]]",
-                            state="visible",
-                            timeout=3000,
-                        )
-                        accept_button = await page.query_selector(
-                            "//button[.//span[contains(text(), 'Accept all')]]"
-                        )
-                        if accept_button:
-                            print("Accepting consent form (Accept all button)...")
-                            await accept_button.click()
-                            consent_clicked = True
-                    except PlaywrightTimeoutError:
-                        pass
-                
-                # Method 3: Try the specific input element xpath you provided
-                if not consent_clicked:
-                    try:
-                        await page.wait_for_selector(
-                            consent_input_xpath,
-                            state="visible",
-                            timeout=3000,
-                        )
-                        consent_input = await page.query_selector(consent_input_xpath)
-                        if consent_input:
-                            print("Accepting consent form (input element)...")
-                            await consent_input.click()
-                            consent_clicked = True
-                    except PlaywrightTimeoutError:
-                        pass
-                
-                # Method 4: Fallback to generic consent button (might be reject)
-                if not consent_clicked:
-                    try:
-                        await page.wait_for_selector(
-                            consent_button_xpath,
-                            state="visible",
-                            timeout=3000,
-                        )
-                        print("Clicking first available consent button...")
-                        await page.locator(consent_button_xpath).first.click()
-                        consent_clicked = True
-                    except PlaywrightTimeoutError:
-                        pass
-                
-                if consent_clicked:
+                    log.info("Accepting consent form...")
+                    remember_consent = True
                     # Wait for navigation/popup closure
                     await page.wait_for_load_state("networkidle", timeout=5000)
-                else:
-                    print("No consent form detected after trying all methods.")
-            except PlaywrightTimeoutError:
-                print("No consent form detected or timed out waiting.")
-            except Exception as e:  # noqa: BLE001  # pylint: disable=broad-except
-                print(f"Error handling consent form: {e}")
+                except PlaywrightTimeoutError:
+                    log.info("No consent form detected or timed out waiting.")
+                    # A timeout is only "no form" if we are not on the consent page;
+                    # a slow-rendering form must be retried on the next scrape
+                    remember_consent = remember_consent or CONSENT_PAGE_MARKER not in page.url
+                except Exception as e:  # noqa: BLE001  # pylint: disable=broad-except
+                    log.warning("Error handling consent form: %s", e)
+                if remember_consent:
+                    # Accepted or verifiably past consent: its cookies (none when no
+                    # form was shown) are enough for this language from now on
+                    CONSENT_COOKIES[lang] = [
+                        cookie
+                        for cookie in await context.cookies()
+                        if cookie["name"] in CONSENT_COOKIE_NAMES
+                    ]
 
 
             # --- Scrolling and Link Extraction ---
-            print("Scrolling to load places...")
+            log.info("Scrolling to load places...")
             feed_selector = '[role="feed"]'
             try:
                 await page.wait_for_selector(
@@ -176,121 +376,79 @@ async def scrape_google_maps(query, max_places=None, lang="en", headless=True):
             except PlaywrightTimeoutError:
                  # Check if it's a single result page (maps/place/)
                 if "/maps/place/" in page.url:
-                    print("Detected single place page.")
+                    log.info("Detected single place page.")
                     place_links.add(page.url)
                 else:
-                    print(
-                        f"Error: Feed element '{feed_selector}' not found. "
-                        "Maybe no results or page structure changed."
+                    log.error(
+                        "Feed element '%s' not found. "
+                        "Maybe no results or page structure changed.",
+                        feed_selector,
                     )
-                    await browser.close()
                     return []
 
             if await page.locator(feed_selector).count() > 0:
-                last_height = await page.evaluate(
-                    f"document.querySelector('{feed_selector}').scrollHeight"
-                )
+                await page.evaluate("window.__gmapsSeen = new Set()")
+                stalls = 0
                 while True:
-                    # Scroll down
-                    await page.evaluate(
-                        f"document.querySelector('{feed_selector}').scrollTop = "
-                        f"document.querySelector('{feed_selector}').scrollHeight"
+                    # One round-trip scrolls the feed several times in-page
+                    batch = await page.evaluate(
+                        SCROLL_AND_COLLECT_JS,
+                        [
+                            feed_selector,
+                            SCROLL_PAUSE_TIME * 1000,
+                            SCROLLS_PER_EVALUATE,
+                            max_places or 0,
+                            MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS,
+                            stalls,
+                        ],
                     )
-                    await asyncio.sleep(SCROLL_PAUSE_TIME)
-
-                    # Extract links after scroll
-                    current_links_list = await page.locator(
-                        f'{feed_selector} a[href*="/maps/place/"]'
-                    ).evaluate_all("elements => elements.map(a => a.href)")
-                    current_links = set(current_links_list)
-                    new_links_found = len(current_links - place_links) > 0
-                    place_links.update(current_links)
-                    print(f"Found {len(place_links)} unique place links so far...")
+                    place_links.update(batch["links"])
+                    stalls = batch["stalls"]
+                    log.info("Found %d unique place links so far...", len(place_links))
 
                     if max_places is not None and len(place_links) >= max_places:
-                        print(f"Reached max_places limit ({max_places}).")
+                        log.info("Reached max_places limit (%d).", max_places)
                         place_links = set(list(place_links)[:max_places]) # Trim excess links
                         break
 
-                    # Check if scroll height has changed
-                    new_height = await page.evaluate(
-                        f"document.querySelector('{feed_selector}').scrollHeight"
-                    )
-                    if new_height == last_height:
-                        # Check for the "end of results" marker
-                        end_marker_xpath = (
-                            "//span[contains(text(), \"You've reached the end of the list.\")]"
-                        )
-                        if await page.locator(end_marker_xpath).count() > 0:
-                            print("Reached the end of the results list.")
-                            break
+                    if batch["done"]:
+                        if stalls >= MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS:
+                            log.info("Stopping scroll due to lack of new links.")
                         else:
-                            # If height didn't change and marker missing, maybe loading issue?
-                            # Increment no-new-links counter
-                            if not new_links_found:
-                                scroll_attempts_no_new += 1
-                                print(
-                                    "Scroll height unchanged and no new links. "
-                                    f"Attempt {scroll_attempts_no_new}/"
-                                    f"{MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS}"
-                                )
-                                if (
-                                    scroll_attempts_no_new
-                                    >= MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS
-                                ):
-                                    print("Stopping scroll due to lack of new links.")
-                                    break
-                            else:
-                                scroll_attempts_no_new = 0  # Reset when new links found
-                    else:
-                        last_height = new_height
-                        scroll_attempts_no_new = 0 # Reset if scroll height changed
-
-                    # Optional: Add a hard limit on scrolls to prevent infinite loops
-                    # if scroll_count > MAX_SCROLLS: break
+                            log.info("Reached the end of the results list.")
+                        break
 
             # --- Scraping Individual Places ---
-            print(f"\nScraping details for {len(place_links)} places...")
-            count = 0
-            for link in place_links:
-                count += 1
-                print(f"Processing link {count}/{len(place_links)}: {link}") # Keep sync print
-                try:
-                    await page.goto(link, wait_until='domcontentloaded') # Added await
-                    # Wait a bit for dynamic content if needed, or wait for a specific element
-                    # await page.wait_for_load_state('networkidle', timeout=10000)
-
-                    html_content = await page.content() # Added await
-                    place_data = extractor.extract_place_data(html_content)
-
-                    if place_data:
-                        place_data['link'] = link # Add the source link
-                        results.append(place_data)
-                        # print(json.dumps(place_data, indent=2))
-                    else:
-                        print(f"  - Failed to extract data for: {link}")
-                        # Optionally save the HTML for debugging
-                        # with open(f"error_page_{count}.html", "w", encoding="utf-8") as f:
-                        #     f.write(html_content)
-
-                except PlaywrightTimeoutError:
-                    print(f"  - Timeout navigating to or processing: {link}")
-                except Exception as e:  # noqa: BLE001  # pylint: disable=broad-except
-                    print(f"  - Error processing {link}: {e}")
-                await asyncio.sleep(0.5) # Changed to asyncio.sleep, added await
+            # Place pages embed their data in the initial HTML, so fetch them over
+            # plain HTTP (reusing the browser's consent cookies) and only render
+            # the ones that fail in Playwright.
+            log.info("Scraping details for %d places...", len(place_links))
+            fallback_q = asyncio.Queue()
+            semaphore = asyncio.Semaphore(HTTP_FETCH_CONCURRENCY)
+            async with aiohttp.ClientSession(
+                cookie_jar=_cookie_jar_from_browser(await context.cookies()),
+                headers={"User-Agent": USER_AGENT, "Accept-Language": lang},
+                timeout=aiohttp.ClientTimeout(total=HTTP_FETCH_TIMEOUT),
+            ) as session:
+                await asyncio.gather(
+                    *[
+                        _fetch_and_extract(session, semaphore, link, results, fallback_q)
+                        for link in place_links
+                    ]
+                )
 
-            await browser.close() # Added await
+            if not fallback_q.empty():
+                log.info("Falling back to the browser for %d places...", fallback_q.qsize())
+                workers = [
+                    asyncio.create_task(_scrape_place_worker(context, fallback_q, results))
+                    for _ in range(min(concurrency, fallback_q.qsize()))
+                ]
+                await asyncio.gather(*workers)
 
         except PlaywrightTimeoutError:
-            print("Timeout error during scraping process.")
+            log.error("Timeout error during scraping process.")
         except Exception as e:  # noqa: BLE001  # pylint: disable=broad-except
-            print(f"An error occurred during scraping: {e}")
-            import traceback
-            traceback.print_exc() # Print detailed traceback for debugging
-        finally:
-            # Ensure browser is closed if an error occurred mid-process
-            if browser and browser.is_connected(): # Check if browser exists and is connected
-                await browser.close() # Added await
-
-    print(f"\nScraping finished. Found details for {len(results)} places.")
+            log.exception("An error occurred during scraping: %s", e)
+
+    log.info("Scraping finished. Found details for %d places.", len(results))
     return results
@@ -2,20 +2,22 @@
 
 import logging
 import asyncio
-import concurrent.futures
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Optional, List, Dict, Any
-from fastapi import FastAPI, HTTPException, Query, Header, Depends
+from fastapi import FastAPI, HTTPException, Query, Header, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from slade_digital_scrapers.core.config import (
-    ALLOWED_ORIGINS,
-    LOG_LEVEL,
-    API_KEY,
-)
-from slade_digital_scrapers.infrastructure.models.entities.repository import (
-    upsert_entities,
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from slade_digital_scrapers.core.config import SETTINGS
+from slade_digital_scrapers.infrastructure.database.connection import (
+    close_async_pool,
+    warm_async_pool,
 )
 from slade_digital_scrapers.infrastructure.models.scraper_hisotry.repository import (
-    upsert_scrape_history,
+    upsert_scrape_with_entities_async,
 )
 from slade_digital_scrapers.infrastructure.models.scraper_hisotry.schema import (
     ScrapeHistoryContract,
@@ -24,45 +26,117 @@ from slade_digital_scrapers.infrastructure.models.scraper_hisotry.schema import
 # Import the scraper function (adjust path if necessary)
 try:
     from slade_digital_scrapers.gmaps_scraper.scraper import (
+        DEFAULT_CONCURRENCY,
+        launch_shared_browser,
         scrape_google_maps,
+        shutdown_parse_pool,
+        start_parse_pool,
     )
 except ImportError:
     # Handle case where scraper might be in a different structure later
     logging.error("Could not import scrape_google_maps from scraper.py")
+    DEFAULT_CONCURRENCY = 1
     # Define a dummy function to allow API to start, but fail on call
     def scrape_google_maps(*args, **kwargs):
         """Define a dummy function to allow API to start, but fail on call"""
         raise ImportError("Scraper function not available.")
 
+    async def launch_shared_browser(*args, **kwargs):
+        """Without the scraper there is no browser to share."""
+        return None, None
+
+    def start_parse_pool(*args, **kwargs):
+        """Without the scraper there is nothing to parse."""
+
+    def shutdown_parse_pool():
+        """Without the scraper there is nothing to parse."""
+
 # Configure basic logging
 logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL.upper(), logging.INFO),
+    level=getattr(logging, SETTINGS.log_level.upper(), logging.INFO),
     format="%(asctime)s - %(levelname)s - %(message)s",
 )
 
+def _start_log_listener() -> QueueListener:
+    """
+    Route root log records through a queue so handler I/O runs on the listener's
+    thread instead of the event loop.
+    """
+    root = logging.getLogger()
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+def _stop_log_listener(listener: QueueListener) -> None:
+    """Flush queued records and give the original handlers back to the root logger."""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+@asynccontextmanager
+async def lifespan(app_: FastAPI):
+    """
+    Move logging off the event loop, open and warm the asyncpg pool, start the
+    parse pool and launch the shared headless browser on startup; release all of
+    them on shutdown.
+
+    Warming the pool and launching the browser are best-effort: the API still
+    boots (and `/health` answers) without a database, and scrapes launch their
+    own browser when there is no shared one.
+    """
+    app_.state.browser = None
+    # Each step registers its own cleanup as soon as it has started, so a failure
+    # later in startup still releases everything before it
+    async with AsyncExitStack() as cleanup:
+        cleanup.callback(_stop_log_listener, _start_log_listener())
+
+        cleanup.push_async_callback(close_async_pool)
+        try:
+            await warm_async_pool()
+        except Exception as e:  # noqa: BLE001  # pylint: disable=broad-except
+            logging.warning("Could not warm the database pool, continuing without it: %s", e)
+
+        # Every uvicorn worker gets its own parse pool, so split the CPUs between them
+        start_parse_pool(max(1, (os.cpu_count() or 1) // max(1, SETTINGS.web_concurrency)))
+        cleanup.callback(shutdown_parse_pool)
+
+        try:
+            playwright, browser = await launch_shared_browser(headless=True)
+        except Exception as e:  # noqa: BLE001  # pylint: disable=broad-except
+            logging.warning("Could not launch the shared browser, scrapes will launch their own: %s", e)
+        else:
+            if playwright is not None:
+                cleanup.push_async_callback(playwright.stop)
+            if browser is not None:
+                cleanup.push_async_callback(browser.close)
+            app_.state.browser = browser
+
+        yield
+
 app = FastAPI(
     title="Slade Digital Scrapers",
     description="API to trigger Google Maps scraping based on a query.",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Enable CORS so ToolJet/other clients can call the API from a browser.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=ALLOWED_ORIGINS or ["*"],
+    allow_origins=list(SETTINGS.allowed_origins) or ["*"],
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Thread pool for running blocking database operations
-executor = concurrent.futures.ThreadPoolExecutor(
-    max_workers=4
-)
+# Scrape results are repetitive JSON, so compress anything over 1KB.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 async def require_api_key(x_api_key: str = Header(default="", convert_underscores=False)) -> None:
     """Simple header-based auth for the API."""
-    if API_KEY and x_api_key == API_KEY:
+    if SETTINGS.api_key and x_api_key == SETTINGS.api_key:
         return
     # If API_KEY is unset, deny by default to avoid accidental open exposure
     raise HTTPException(status_code=401, detail="Unauthorized")
@@ -78,6 +152,7 @@ async def health_check():
     response_model=List[Dict[str, Any]],
 )
 async def run_scrape(  # type: ignore[override]
+    request: Request,
     _auth: None = Depends(require_api_key),
     query: str = Query(
         ...,
@@ -98,6 +173,12 @@ async def run_scrape(  # type: ignore[override]
         description="Run the browser in headless mode (no UI). "
         "Set to false for debugging locally.",
     ),
+    concurrency: int = Query(
+        DEFAULT_CONCURRENCY,
+        ge=1,
+        le=32,
+        description="Number of browser pages scraping place details in parallel.",
+    ),
 ):
     """
     Triggers the Google Maps scraping process for the given query.
@@ -105,11 +186,13 @@ async def run_scrape(  # type: ignore[override]
     logging.info("=" * 60)
     logging.info("ENDPOINT CALLED: /google_maps/scrape")
     logging.info(
-        "Received scrape request for query %r, max_places %s, lang %s, headless %s",
+        "Received scrape request for query %r, max_places %s, lang %s, "
+        "headless %s, concurrency %s",
         query,
         max_places,
         lang,
         headless,
+        concurrency,
     )
 
     try:
@@ -121,6 +204,11 @@ async def run_scrape(  # type: ignore[override]
                 detail="Scraper function not available. Check server logs."
             )
 
+        # Headed runs (local debugging) launch their own browser
+        shared_browser = request.app.state.browser
+        if not headless or shared_browser is None or not shared_browser.is_connected():
+            shared_browser = None
+
         logging.info("Starting scraper function...")
         # Run the potentially long-running scraping task with timeout
         # Note: For production, consider running this in a background task
@@ -131,7 +219,9 @@ async def run_scrape(  # type: ignore[override]
                 query=query,
                 max_places=max_places,
                 lang=lang,
-                headless=headless
+                headless=headless,
+                concurrency=concurrency,
+                browser=shared_browser,
             ),
             timeout=300  # 5 minutes timeout
         )
@@ -142,15 +232,6 @@ async def run_scrape(  # type: ignore[override]
             len(results),
         )
 
-        # Run blocking database operations in thread pool to avoid blocking
-        # async event loop
-        loop = asyncio.get_event_loop()
-
-        # Adding the results in my db
-        rows_added = await loop.run_in_executor(
-            executor, upsert_entities, results
-        )
-
         # Recording the scraper request
         # Generate a unique source identifier from the query
         source_id = (
@@ -164,10 +245,10 @@ async def run_scrape(  # type: ignore[override]
             results_scraped=len(results)
         )
 
-        await loop.run_in_executor(
-            executor,
-            upsert_scrape_history,
-            [history_record.to_repository_dict()]
+        # Adding the results in my db; entities and the history row are written
+        # in one transaction and `results_scraped` counts the upserted entities
+        rows_added = await upsert_scrape_with_entities_async(
+            results, history_record.to_repository_dict()
         )
 
         logging.info(
@@ -1,11 +1,15 @@
 """Main entry point for the FastAPI app."""
 
 import uvicorn
-from slade_digital_scrapers.core.config import PORT
+from slade_digital_scrapers.core.config import SETTINGS
 
 if __name__ == "__main__":
     uvicorn.run(
         "slade_digital_scrapers.infrastructure.api.api:app",
         host="0.0.0.0",
-        port=PORT,
+        port=SETTINGS.port,
+        loop="uvloop",
+        http="httptools",
+        workers=SETTINGS.web_concurrency,
+        backlog=4096,
     )
@@ -1,32 +1,22 @@
 '''Creates database'''
 
 import psycopg2
-from slade_digital_scrapers.core.config import DB_HOST, DB_NAME, DB_USER, DB_PASSWORD, DB_PORT
+from slade_digital_scrapers.infrastructure.database.connection import db_connection
 
-def test_connection():
+def test_connection(conn=None):
     """
     Test the connection to the Supabase PostgreSQL database.
+    Args:
+    conn: Optional connection to check instead of checking one out of the pool.
     Returns:
     bool: True if connection is successful, False otherwise.
     """
     try:
-        # Connect to the database
-        conn = psycopg2.connect(
-            host=DB_HOST,
-            dbname=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            port=DB_PORT
-        )
-        # Create a cursor and execute a test query
-        cursor = conn.cursor()
-        cursor.execute("SELECT version();")
-        db_version = cursor.fetchone()
+        with db_connection(conn) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT version();")
+                db_version = cursor.fetchone()
         print("Connected to PostgreSQL version:", db_version)
-
-        # Clean up
-        cursor.close()
-        conn.close()
         return True
 
     except psycopg2.Error as e:
@@ -97,40 +87,33 @@ def create_tables():
     ]
 
     try:
-        connection = psycopg2.connect(
-            host=DB_HOST,
-            dbname=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            port=DB_PORT
-        )
-        connection.autocommit = True
-        cursor = connection.cursor()
-
-        for table_name, command in tables:
-            # Check if the table exists in the public schema.
-            cursor.execute(
-                """SELECT EXISTS 
-                (SELECT 1 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' AND table_name = %s
-                )""",
-                (table_name,)
-            )
-            exists_result = cursor.fetchone()
-            exists = exists_result[0] if exists_result else False  # Fixing the issue here
-
-            if exists:
-                print(f"Table '{table_name}' already exists. Skipping creation.")
-            else:
-                cursor.execute(command)
-                print(f"Executed creation command for table '{table_name}':\n{command}")
-
-        # Ensure unique constraints exist
-        _ensure_constraints(cursor)
-        
-        cursor.close()
-        connection.close()
+        with db_connection() as conn:
+            # DDL runs in autocommit so a failed constraint doesn't abort the rest;
+            # restore the default before the connection goes back to the pool.
+            conn.autocommit = True
+            try:
+                with conn.cursor() as cursor:
+                    # Check which tables already exist in the public schema in one query.
+                    cursor.execute(
+                        """SELECT table_name
+                        FROM information_schema.tables
+                        WHERE table_schema = 'public' AND table_name = ANY(%s)""",
+                        ([table_name for table_name, _ in tables],)
+                    )
+                    existing_tables = {row[0] for row in cursor.fetchall()}
+
+                    for table_name, command in tables:
+                        if table_name in existing_tables:
+                            print(f"Table '{table_name}' already exists. Skipping creation.")
+                        else:
+                            cursor.execute(command)
+                            print(f"Executed creation command for table '{table_name}':\n{command}")
+
+                    # Ensure unique constraints exist
+                    _ensure_constraints(cursor)
+                    _ensure_indexes(cursor)
+            finally:
+                conn.autocommit = False
         print("Tables checked/created successfully.")
 
     except (psycopg2.Error, ValueError) as error:
@@ -146,24 +129,24 @@ def _ensure_constraints(cursor):
             "constraint_name": "entities_place_id_key",
             "sql": "ALTER TABLE entities ADD CONSTRAINT entities_place_id_key UNIQUE (place_id);"
         },
+        {
+            "table": "scrape_history",
+            "column": "source",
+            "constraint_name": "scrape_history_source_key",
+            "sql": "ALTER TABLE scrape_history ADD CONSTRAINT scrape_history_source_key UNIQUE (source);"
+        },
     ]
-    
+
+    # Look up every constraint in one round-trip
+    cursor.execute(
+        "SELECT conname FROM pg_constraint WHERE conname = ANY(%s)",
+        ([constraint["constraint_name"] for constraint in constraints],)
+    )
+    existing_constraints = {row[0] for row in cursor.fetchall()}
+
     for constraint in constraints:
         try:
-            # Check if constraint already exists
-            cursor.execute(
-                """
-                SELECT EXISTS (
-                    SELECT 1 
-                    FROM pg_constraint 
-                    WHERE conname = %s
-                )
-                """,
-                (constraint["constraint_name"],)
-            )
-            exists = cursor.fetchone()[0]
-            
-            if not exists:
+            if constraint["constraint_name"] not in existing_constraints:
                 cursor.execute(constraint["sql"])
                 print(f"Added unique constraint '{constraint['constraint_name']}' to {constraint['table']}.{constraint['column']}")
             else:
@@ -174,6 +157,27 @@ def _ensure_constraints(cursor):
                 print(f"Warning: Could not add constraint '{constraint['constraint_name']}': {e}")
 
 
+
+def _ensure_indexes(cursor):
+    """Create secondary indexes that are missing (idempotent)."""
+    indexes = [
+        # Rows arrive in created_at order, so a BRIN index stays a few pages in size
+        # where a btree would grow with every scraped entity.
+        (
+            "entities_created_at_brin",
+            "CREATE INDEX IF NOT EXISTS entities_created_at_brin "
+            "ON entities USING BRIN (created_at);",
+        ),
+    ]
+
+    for index_name, command in indexes:
+        try:
+            cursor.execute(command)
+            print(f"Index '{index_name}' checked/created.")
+        except psycopg2.Error as e:
+            print(f"Warning: Could not create index '{index_name}': {e}")
+
+
 if __name__ == '__main__':
     if test_connection():
         print("Connected.")
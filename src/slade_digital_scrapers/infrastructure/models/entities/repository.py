@@ -1,9 +1,14 @@
 """Persistence helpers for the `entities` table."""
 
 from __future__ import annotations
+import io
+from itertools import islice
 from typing import Any, Iterable, Mapping, Sequence
-from psycopg2.extras import execute_values
-from slade_digital_scrapers.infrastructure.database.connection import db_connection
+from psycopg2.extras import execute_batch
+from slade_digital_scrapers.infrastructure.database.connection import (
+    async_db_connection,
+    db_connection,
+)
 
 ENTITY_COLUMNS: Sequence[str] = (
     "name",
@@ -17,9 +22,7 @@ ENTITY_COLUMNS: Sequence[str] = (
     "google_link",
 )
 
-UPSERT_SQL = f"""
-INSERT INTO entities ({", ".join(ENTITY_COLUMNS)})
-VALUES %s
+UPSERT_CONFLICT_SQL = """
 ON CONFLICT (place_id) DO UPDATE
 SET
     name = EXCLUDED.name,
@@ -32,14 +35,64 @@ SET
     google_link = EXCLUDED.google_link
 """
 
-def upsert_entities(records: Iterable[Mapping[str, Any]], page_size: int = 250) -> int:
+UPSERT_SQL = f"""
+INSERT INTO entities ({", ".join(ENTITY_COLUMNS)})
+VALUES %s
+{UPSERT_CONFLICT_SQL}"""
+
+# Single-row form of UPSERT_SQL with positional ($n) placeholders, used by asyncpg
+# and as the body of the server-side prepared statement.
+UPSERT_ROW_SQL = UPSERT_SQL.replace(
+    "VALUES %s",
+    "VALUES (" + ", ".join(f"${i}" for i in range(1, len(ENTITY_COLUMNS) + 1)) + ")",
+)
+
+PREPARED_UPSERT_NAME = "gmaps_entity_upsert"
+EXECUTE_UPSERT_SQL = (
+    f"EXECUTE {PREPARED_UPSERT_NAME} (" + ", ".join(["%s"] * len(ENTITY_COLUMNS)) + ")"
+)
+
+# Batches at least this large are loaded with COPY into a staging table instead;
+# rows are also encoded and sent in chunks of this size
+COPY_THRESHOLD = 1000
+
+# The staging table has the entity columns plus an arrival counter, so the last
+# record for a repeated place_id wins, as it does on the row-by-row path.
+CREATE_STAGE_SQL = f"""
+CREATE TEMP TABLE entities_stage ON COMMIT DROP AS
+SELECT {", ".join(ENTITY_COLUMNS)} FROM entities WITH NO DATA;
+ALTER TABLE entities_stage ADD COLUMN stage_seq BIGINT GENERATED ALWAYS AS IDENTITY;
+"""
+
+COPY_STAGE_SQL = (
+    f"COPY entities_stage ({', '.join(ENTITY_COLUMNS)}) FROM STDIN WITH (FORMAT text)"
+)
+
+# Rows without a place_id never conflict, so each one is kept.
+MERGE_STAGE_SQL = f"""
+INSERT INTO entities ({", ".join(ENTITY_COLUMNS)})
+SELECT DISTINCT ON (place_id, CASE WHEN place_id IS NULL THEN stage_seq END)
+    {", ".join(ENTITY_COLUMNS)}
+FROM entities_stage
+ORDER BY place_id, CASE WHEN place_id IS NULL THEN stage_seq END, stage_seq DESC
+{UPSERT_CONFLICT_SQL}"""
+
+# ON COMMIT DROP only fires at the end of the transaction; dropping the stage right
+# after the merge lets a caller's transaction load several batches.
+DROP_STAGE_SQL = "DROP TABLE entities_stage"
+
+def upsert_entities(
+    records: Iterable[Mapping[str, Any]], page_size: int = 500, conn=None
+) -> int:
     """
     Bulk upsert entity payloads into the `entities` table.
 
     Args:
         records: Iterable of dict-like objects that follow the Google Maps
             scraper contract (see response_*.json example).
-        page_size: Optional batch size for `execute_values`.
+        page_size: Optional batch size for `execute_batch`.
+        conn: Optional pooled connection to run on; the caller then owns the
+            transaction and commits it.
 
     Returns:
         Number of rows that were attempted (inserted + updated).
@@ -47,46 +100,129 @@ def upsert_entities(records: Iterable[Mapping[str, Any]], page_size: int = 250)
     Notes:
         - Requires a unique constraint on `entities.place_id`. Example:
           `ALTER TABLE entities ADD CONSTRAINT entities_place_id_key UNIQUE (place_id);`
-        - Uses a single INSERT ... ON CONFLICT statement per batch to keep the
-          memory and round-trips minimal.
+        - Runs a server-side prepared INSERT ... ON CONFLICT statement (prepared
+          once per pooled connection) and sends `page_size` executions per
+          round-trip, so the statement is parsed and planned only once.
+        - Batches of `COPY_THRESHOLD` rows or more are streamed with COPY into a
+          temporary staging table and merged with a single INSERT ... SELECT.
+        - `records` is consumed lazily: at most `COPY_THRESHOLD` rows are held in
+          memory at once, so generators of any size can be passed.
+    """
+
+    rows = (_to_row(record) for record in records if record)
+    chunk = list(islice(rows, COPY_THRESHOLD))
+    if not chunk:
+        return 0
+
+    count = 0
+    with db_connection(conn) as db:
+        with db.cursor() as cursor:
+            if len(chunk) < COPY_THRESHOLD:
+                db.prepare(PREPARED_UPSERT_NAME, UPSERT_ROW_SQL)
+                execute_batch(cursor, EXECUTE_UPSERT_SQL, chunk, page_size=page_size)
+                count = len(chunk)
+            else:
+                cursor.execute(CREATE_STAGE_SQL)
+                while chunk:
+                    cursor.copy_expert(COPY_STAGE_SQL, _to_copy_buffer(chunk))
+                    count += len(chunk)
+                    chunk = list(islice(rows, COPY_THRESHOLD))
+                cursor.execute(MERGE_STAGE_SQL)
+                cursor.execute(DROP_STAGE_SQL)
+        if conn is None:
+            db.commit()
+
+    return count
+
+
+async def upsert_entities_async(records: Iterable[Mapping[str, Any]], conn=None) -> int:
+    """
+    Async counterpart of `upsert_entities` backed by the asyncpg pool.
+
+    Args:
+        records: Iterable of dict-like objects that follow the Google Maps
+            scraper contract (see response_*.json example).
+        conn: Optional asyncpg connection to run on; the caller then owns the
+            transaction.
+
+    Returns:
+        Number of rows that were attempted (inserted + updated). On the COPY
+        path this is the number of rows the merge upserted, so a repeated
+        place_id is counted once.
+
+    Notes:
+        - Batches of `COPY_THRESHOLD` rows or more are loaded with asyncpg's binary
+          COPY into the staging table and merged like the sync path.
     """
 
     rows = [_to_row(record) for record in records if record]
     if not rows:
         return 0
 
-    with db_connection() as conn:
-        with conn.cursor() as cursor:
-            execute_values(
-                cursor,
-                UPSERT_SQL,
-                rows,
-                template="(" + ", ".join(["%s"] * len(ENTITY_COLUMNS)) + ")",
-                page_size=page_size,
+    async with async_db_connection(conn) as db:
+        if len(rows) < COPY_THRESHOLD:
+            await db.executemany(UPSERT_ROW_SQL, rows)
+            return len(rows)
+        async with db.transaction():
+            await db.execute(CREATE_STAGE_SQL)
+            await db.copy_records_to_table(
+                "entities_stage", records=rows, columns=ENTITY_COLUMNS
             )
-        conn.commit()
-
-    return len(rows)
+            # The command tag reads "INSERT 0 <rows upserted>"
+            status = await db.execute(MERGE_STAGE_SQL)
+            await db.execute(DROP_STAGE_SQL)
+    return int(status.rsplit(" ", 1)[1])
 
 
 def _to_row(record: Mapping[str, Any]) -> tuple[Any, ...]:
     """Transform the scraper payload into the DB column order."""
-    categories = record.get("categories") or record.get("entity_categories")
-    categories = _clean_categories(categories)
-
+    # Scraper payloads omit empty fields, so keys are looked up with `get` rather
+    # than an itemgetter that would raise on the missing ones.
     return (
         record.get("name"),
         record.get("place_id"),
         record.get("address"),
         _coerce_int(record.get("rating")),
         _coerce_int(record.get("reviews_count")),
-        categories,
+        _clean_categories(record.get("categories") or record.get("entity_categories")),
         record.get("website"),
         record.get("phone"),
         record.get("link"),
     )
 
 
+def _to_copy_buffer(rows: Iterable[Sequence[Any]]) -> io.StringIO:
+    """Encode rows in COPY text format (tab separated, `\\N` for NULL)."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(map(_copy_field, row)))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_field(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, list):
+        value = _array_literal(value)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _array_literal(items: Sequence[str]) -> str:
+    """Render a text[] literal, quoting every element."""
+    quoted = (
+        '"' + item.replace("\\", "\\\\").replace('"', '\\"') + '"' for item in items
+    )
+    return "{" + ",".join(quoted) + "}"
+
+
 def _clean_categories(raw: Any) -> list[str] | None:
     if not raw:
         return None
@@ -95,8 +231,8 @@ def _clean_categories(raw: Any) -> list[str] | None:
 
 
 def _coerce_int(value: Any) -> int | None:
-    if value is None:
-        return None
+    if value is None or type(value) is int:  # pylint: disable=unidiomatic-typecheck
+        return value
     try:
         return int(value)
     except (TypeError, ValueError):
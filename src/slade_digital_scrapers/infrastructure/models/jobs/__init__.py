@@ -0,0 +1 @@
+"""Package entry for the Google Maps scraping server components."""
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""Persistence helpers for the `jobs` table."""
+
+from __future__ import annotations
+import asyncio
+import datetime as dt
+import re
+from typing import Any, Iterable, Mapping, Sequence
+from slade_digital_scrapers.infrastructure.database.connection import async_db_connection
+
+JOB_COLUMNS: Sequence[str] = (
+    "linkedin_url",
+    "job_title",
+    "company",
+    "company_linkedin_url",
+    "location",
+    "posted_date",
+    "application_count",
+    "job_description",
+    "benefits",
+)
+
+# Rows buffered by `drain_jobs` before each COPY
+JOB_BATCH_SIZE = 500
+
+_LEADING_INT_RE = re.compile(r"\d[\d,]*")
+
+
+async def copy_jobs(records: Iterable[Mapping[str, Any]]) -> int:
+    """
+    Append job payloads to the `jobs` table with asyncpg's binary COPY.
+
+    Args:
+        records: Iterable of dict-like objects shaped like `Job.to_dict()`.
+
+    Returns:
+        Number of rows written.
+    """
+
+    rows = [_to_row(record) for record in records if record]
+    if not rows:
+        return 0
+
+    async with async_db_connection() as conn:
+        await conn.copy_records_to_table("jobs", records=rows, columns=JOB_COLUMNS)
+
+    return len(rows)
+
+
+async def drain_jobs(queue: asyncio.Queue, batch_size: int = JOB_BATCH_SIZE) -> int:
+    """
+    Write jobs from `queue` in batches of `batch_size` until a `None` arrives.
+
+    Lets database writes overlap with scraping: the Selenium worker (a thread)
+    pushes `job.to_dict()` with `loop.call_soon_threadsafe(queue.put_nowait, ...)`
+    and puts `None` when done, while this coroutine copies full batches as they fill.
+
+    Returns:
+        Number of rows written.
+    """
+
+    written = 0
+    batch: list[Mapping[str, Any]] = []
+    while True:
+        record = await queue.get()
+        if record is None:
+            break
+        batch.append(record)
+        if len(batch) >= batch_size:
+            written += await copy_jobs(batch)
+            batch = []
+
+    return written + await copy_jobs(batch)
+
+
+async def store_job_search(job_search, search_term: str, batch_size: int = JOB_BATCH_SIZE) -> int:
+    """
+    Run a LinkedIn `JobSearch.search` and copy its jobs to the `jobs` table as they arrive.
+
+    The Selenium search runs on a worker thread and hands each scraped job to
+    `drain_jobs` through a queue, so COPY batches are written while scraping continues.
+
+    Returns:
+        Number of rows written.
+    """
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def push(job) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, job.to_dict())
+
+    def run_search() -> None:
+        try:
+            job_search.search(search_term, on_job=push)
+        finally:
+            # Always release the writer, even if the search fails
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    writer = asyncio.create_task(drain_jobs(queue, batch_size))
+    try:
+        await asyncio.to_thread(run_search)
+    finally:
+        written = await writer
+    return written
+
+
+def _to_row(record: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Transform the scraper payload into the DB column order."""
+    return (
+        record.get("linkedin_url"),
+        record.get("job_title"),
+        record.get("company"),
+        record.get("company_linkedin_url"),
+        record.get("location"),
+        _coerce_date(record.get("posted_date")),
+        _coerce_count(record.get("applicant_count", record.get("application_count"))),
+        record.get("job_description"),
+        record.get("benefits"),
+    )
+
+
+def _coerce_date(value: Any) -> dt.date | None:
+    # LinkedIn often shows relative dates ("2 weeks ago"), which are dropped
+    if isinstance(value, dt.datetime):
+        return value.date()
+    if isinstance(value, dt.date):
+        return value
+    try:
+        return dt.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _coerce_count(value: Any) -> int | None:
+    # Applicant counts arrive as text such as "1,234 applicants"
+    if value is None or type(value) is int:  # pylint: disable=unidiomatic-typecheck
+        return value
+    match = _LEADING_INT_RE.search(str(value))
+    return int(match.group().replace(",", "")) if match else None
@@ -1,9 +1,20 @@
 """Persistence helpers for the `scrape_history` table."""
 
 from __future__ import annotations
-from typing import Any, Iterable, Mapping
-from psycopg2.extras import execute_values
-from slade_digital_scrapers.infrastructure.database.connection import db_connection
+from typing import Any, Iterable, Iterator, Mapping
+import orjson
+from psycopg2.extras import execute_batch, execute_values
+from slade_digital_scrapers.infrastructure.database.connection import (
+    async_db_connection,
+    db_connection,
+)
+from slade_digital_scrapers.infrastructure.models.entities.repository import (
+    COPY_THRESHOLD,
+    ENTITY_COLUMNS,
+    UPSERT_CONFLICT_SQL as ENTITY_UPSERT_CONFLICT_SQL,
+    _to_row as _entity_to_row,
+    upsert_entities_async,
+)
 
 SCRAPE_HISTORY_COLUMNS = ("source", "search_key", "location_key", "results_scraped")
 
@@ -17,83 +28,270 @@ SET
     results_scraped = EXCLUDED.results_scraped
 """
 
+# Single-row form of UPSERT_SQL with positional ($n) placeholders, used by asyncpg
+# and as the body of the server-side prepared statement.
+UPSERT_ROW_SQL = UPSERT_SQL.replace(
+    "VALUES %s",
+    "VALUES (" + ", ".join(f"${i}" for i in range(1, len(SCRAPE_HISTORY_COLUMNS) + 1)) + ")",
+)
 
-def upsert_scrape_history(records: Iterable[Mapping[str, Any]], page_size: int = 100) -> int:
+PREPARED_UPSERT_NAME = "gmaps_scrape_history_upsert"
+EXECUTE_UPSERT_SQL = (
+    f"EXECUTE {PREPARED_UPSERT_NAME} ("
+    + ", ".join(["%s"] * len(SCRAPE_HISTORY_COLUMNS))
+    + ")"
+)
+
+ENTITY_RECORD_TYPES = {
+    "google_rating": "int",
+    "review_count": "int",
+    "entity_categories": "text[]",
+}
+
+# Upserts a JSON batch of entities and the history row for the run in one statement:
+# the entities go in through a writable CTE and `results_scraped` is the number of
+# entities it upserted. Like the COPY merge, the last record wins for a repeated
+# place_id and rows without one are all kept.
+UPSERT_WITH_ENTITIES_SQL = f"""
+WITH batch AS (
+    SELECT DISTINCT ON (place_id, CASE WHEN place_id IS NULL THEN ord END)
+        {", ".join(ENTITY_COLUMNS)}
+    FROM ROWS FROM (
+        jsonb_to_recordset($1::jsonb) AS ({
+            ", ".join(f"{col} {ENTITY_RECORD_TYPES.get(col, 'text')}" for col in ENTITY_COLUMNS)
+        })
+    ) WITH ORDINALITY AS r({", ".join(ENTITY_COLUMNS)}, ord)
+    ORDER BY place_id, CASE WHEN place_id IS NULL THEN ord END, ord DESC
+),
+upserted AS (
+    INSERT INTO entities ({", ".join(ENTITY_COLUMNS)})
+    SELECT {", ".join(ENTITY_COLUMNS)} FROM batch
+{ENTITY_UPSERT_CONFLICT_SQL}
+    RETURNING 1
+)""" + UPSERT_SQL.replace(
+    "VALUES %s", "VALUES ($2, $3, $4, (SELECT count(*) FROM upserted))"
+) + "RETURNING results_scraped"
+
+HISTORY_COLUMNS = ("id", *SCRAPE_HISTORY_COLUMNS, "created_at")
+
+UPSERT_RETURNING_SQL = UPSERT_SQL + f"RETURNING {', '.join(HISTORY_COLUMNS)}"
+
+SELECT_HISTORY_SQL = f"""
+SELECT {", ".join(HISTORY_COLUMNS)}
+FROM scrape_history
+{{where}}
+ORDER BY created_at DESC
+"""
+# Rows fetched per round-trip by the server-side cursor in `iter_scrape_history`
+HISTORY_ITERSIZE = 1000
+
+SELECT_ALL_HISTORY_SQL = SELECT_HISTORY_SQL.format(where="")
+SELECT_HISTORY_BY_SOURCE_SQL = SELECT_HISTORY_SQL.format(where="WHERE source = %s")
+SELECT_HISTORY_BY_SOURCES_SQL = SELECT_HISTORY_SQL.format(where="WHERE source = ANY(%s)")
+
+
+def upsert_scrape_history(
+    records: Iterable[Mapping[str, Any]], page_size: int = 100, conn=None
+) -> int:
     """
     Bulk upsert scrape history records into the `scrape_history` table.
 
     Args:
         records: Iterable of dict-like objects with `source`, `search_key`, `location_key`, and `results_scraped`.
-        page_size: Optional batch size for `execute_values`.
+        page_size: Optional batch size for `execute_batch`.
+        conn: Optional pooled connection to run on; the caller then owns the
+            transaction and commits it.
 
     Returns:
         Number of rows that were attempted (inserted + updated).
 
     Notes:
         - Requires a unique constraint on `scrape_history.source` (already defined in schema).
-        - Uses a single INSERT ... ON CONFLICT statement per batch for efficiency.
-        - Deduplicates records by `source` (keeps the last occurrence) to avoid PostgreSQL errors.
+        - Runs a server-side prepared INSERT ... ON CONFLICT statement and sends
+          `page_size` executions per round-trip.
+        - Each row is its own EXECUTE, so a `source` repeated within the batch is
+          simply updated again and the last occurrence wins; no dedup pass is needed.
+        - Records without a `source` are skipped.
     """
-    # Deduplicate by source (keep last occurrence) to avoid ON CONFLICT errors
-    seen = {}
-    for record in records:
-        if record:
-            source = str(record.get("source", ""))
-            if source:
-                seen[source] = record
-
-    if not seen:
+    rows = _to_rows(records)
+    if not rows:
         return 0
 
-    rows = [_to_row(record) for record in seen.values()]
+    with db_connection(conn) as db:
+        db.prepare(PREPARED_UPSERT_NAME, UPSERT_ROW_SQL)
+        with db.cursor() as cursor:
+            execute_batch(cursor, EXECUTE_UPSERT_SQL, rows, page_size=page_size)
+        if conn is None:
+            db.commit()
+
+    return len(rows)
+
+
+def upsert_scrape_history_returning(
+    records: Iterable[Mapping[str, Any]], conn=None
+) -> list[dict[str, Any]]:
+    """
+    Upsert scrape history records and return the stored rows in the same round-trip.
+
+    Args:
+        records: Iterable of dict-like objects with `source`, `search_key`, `location_key`, and `results_scraped`.
+        conn: Optional pooled connection to run on; the caller then owns the
+            transaction and commits it.
+
+    Returns:
+        List of dictionaries shaped like `get_scrape_history` rows, one per source.
+
+    Notes:
+        - All rows go in one multi-row INSERT ... RETURNING, which Postgres rejects
+          if it touches a row twice, so a repeated `source` is collapsed first and
+          the last occurrence wins, as with `upsert_scrape_history`.
+    """
+    rows = list({row[0]: row for row in _to_rows(records)}.values())
+    if not rows:
+        return []
 
-    with db_connection() as conn:
-        with conn.cursor() as cursor:
-            execute_values(
-                cursor,
-                UPSERT_SQL,
-                rows,
-                template="(" + ", ".join(["%s"] * len(SCRAPE_HISTORY_COLUMNS)) + ")",
-                page_size=page_size,
+    with db_connection(conn) as db:
+        with db.cursor() as cursor:
+            returned = execute_values(
+                cursor, UPSERT_RETURNING_SQL, rows, page_size=len(rows), fetch=True
             )
-        conn.commit()
+        if conn is None:
+            db.commit()
+
+    return [dict(zip(HISTORY_COLUMNS, row)) for row in returned]
+
+
+async def upsert_scrape_history_async(
+    records: Iterable[Mapping[str, Any]], conn=None
+) -> int:
+    """
+    Async counterpart of `upsert_scrape_history` backed by the asyncpg pool.
+
+    Args:
+        records: Iterable of dict-like objects with `source`, `search_key`, `location_key`, and `results_scraped`.
+        conn: Optional asyncpg connection to run on; the caller then owns the
+            transaction.
+
+    Returns:
+        Number of rows that were attempted (inserted + updated).
+    """
+    rows = _to_rows(records)
+    if not rows:
+        return 0
+
+    async with async_db_connection(conn) as db:
+        await db.executemany(UPSERT_ROW_SQL, rows)
 
     return len(rows)
 
 
-def get_scrape_history(source: str | None = None) -> list[dict[str, Any]]:
+async def upsert_scrape_with_entities_async(
+    entities: Iterable[Mapping[str, Any]], history: Mapping[str, Any]
+) -> int:
+    """
+    Upsert a scrape's entities and its `scrape_history` row in one transaction.
+
+    Args:
+        entities: Iterable of scraper payloads, as for `upsert_entities_async`.
+        history: Dict-like object with `source`, `search_key` and `location_key`;
+            `results_scraped` is ignored and set to the number of entities upserted.
+
+    Returns:
+        Number of entities upserted, as recorded in `results_scraped`.
+
+    Notes:
+        - Below `COPY_THRESHOLD` entities, both tables are written by a single
+          statement (one round-trip and one commit instead of one per table).
+        - Larger scrapes load the entities with binary COPY through the staging
+          table, then write the history row on the same connection and in the
+          same transaction, so it is only stored if the entities are.
+        - Either way a repeated place_id is counted once.
+    """
+    records = [record for record in entities if record]
+
+    if len(records) >= COPY_THRESHOLD:
+        async with async_db_connection() as conn:
+            async with conn.transaction():
+                upserted = await upsert_entities_async(records, conn=conn)
+                await upsert_scrape_history_async(
+                    [{**history, "results_scraped": upserted}], conn=conn
+                )
+        return upserted
+
+    source, search_key, location_key, _ = _to_row(history)
+    batch = orjson.dumps(
+        [dict(zip(ENTITY_COLUMNS, _entity_to_row(record))) for record in records]
+    ).decode()
+
+    async with async_db_connection() as conn:
+        return await conn.fetchval(
+            UPSERT_WITH_ENTITIES_SQL, batch, source, search_key, location_key
+        )
+
+
+def get_scrape_history(
+    source: str | None = None, sources: Iterable[str] | None = None, conn=None
+) -> list[dict[str, Any]]:
     """
     Fetch scrape history records from the database.
 
     Args:
         source: Optional filter by source identifier. If None, returns all records.
+        sources: Optional filter by several source identifiers; takes precedence
+            over `source`.
+        conn: Optional pooled connection to read on (sees its uncommitted writes).
 
     Returns:
         List of dictionaries with scrape history data.
     """
-    with db_connection() as conn:
-        with conn.cursor() as cursor:
-            if source:
-                cursor.execute(
-                    """
-                    SELECT id, source, search_key, location_key, results_scraped, created_at
-                    FROM scrape_history
-                    WHERE source = %s
-                    ORDER BY created_at DESC
-                    """,
-                    (source,),
-                )
-            else:
-                cursor.execute(
-                    """
-                    SELECT id, source, search_key, location_key, results_scraped, created_at
-                    FROM scrape_history
-                    ORDER BY created_at DESC
-                    """
-                )
+    return list(iter_scrape_history(source, sources=sources, conn=conn))
+
+
+def iter_scrape_history(
+    source: str | None = None,
+    sources: Iterable[str] | None = None,
+    itersize: int = HISTORY_ITERSIZE,
+    conn=None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream scrape history records through a server-side cursor.
+
+    Args:
+        source: Optional filter by source identifier. If None, yields all records.
+        sources: Optional filter by several source identifiers; takes precedence
+            over `source`.
+        itersize: Rows fetched from the server per round-trip.
+        conn: Optional pooled connection to read on; its transaction is left open.
+
+    Yields:
+        Dictionaries with scrape history data, newest first.
+
+    Notes:
+        - Only `itersize` rows are held in memory at a time. The pooled
+          connection stays checked out until the generator is exhausted or closed.
+    """
+    with db_connection(conn) as db:
+        try:
+            with db.cursor(name="scrape_history_cursor") as cursor:
+                cursor.itersize = itersize
+                if sources is not None:
+                    cursor.execute(SELECT_HISTORY_BY_SOURCES_SQL, (list(sources),))
+                elif source:
+                    cursor.execute(SELECT_HISTORY_BY_SOURCE_SQL, (source,))
+                else:
+                    cursor.execute(SELECT_ALL_HISTORY_SQL)
+
+                for row in cursor:
+                    yield dict(zip(HISTORY_COLUMNS, row))
+        finally:
+            if conn is None:
+                # Ends the read-only transaction the named cursor lived in
+                db.rollback()
+
 
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+def _to_rows(records: Iterable[Mapping[str, Any]]) -> list[tuple[Any, ...]]:
+    """Convert records that carry a source, keeping their order."""
+    return [_to_row(record) for record in records if record and record.get("source")]
 
 
 def _to_row(record: Mapping[str, Any]) -> tuple[str, str | None, str | None, int | None]:
@@ -2,8 +2,9 @@
 
 import os
 import urllib.parse
-from time import sleep
-from typing import List
+from typing import Callable, List, Optional
+
+from selenium.webdriver.common.by import By
 
 from .jobs import Job
 from .objects import Scraper
@@ -72,7 +73,6 @@ class JobSearch(Scraper):
         driver.get(self.base_url)
         if scrape_recommended_jobs:
             self.focus()
-            sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
             job_area = self.wait_for_element_to_load(name="scaffold-finite-scroll__content")
             areas = self.wait_for_all_elements_to_load(name="artdeco-card", base=job_area)
             for i, area in enumerate(areas):
@@ -87,33 +87,39 @@ class JobSearch(Scraper):
         return
 
 
-    def search(self, search_term: str) -> List[Job]:
-        """Execute a keyword search and return the resulting job cards."""
+    def search(
+        self, search_term: str, on_job: Optional[Callable[[Job], None]] = None
+    ) -> List[Job]:
+        """
+        Execute a keyword search and return the resulting job cards.
+
+        `on_job`, when given, is called with each job as soon as its card is
+        scraped, so a consumer (e.g. `store_job_search`) can persist jobs while
+        the rest of the listing is still being read.
+        """
 
         url = os.path.join(
             self.base_url, "search") + f"?keywords={urllib.parse.quote(search_term)}&refresh=true"
         self.driver.get(url)
         self.scroll_to_bottom()
         self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
 
         job_listing_class_name = "jobs-search-results-list"
         job_listing = self.wait_for_element_to_load(name=job_listing_class_name)
 
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.3)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.6)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 1)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
+        # Each scroll lazy-loads more cards; wait for them instead of a fixed sleep
+        card_count = len(job_listing.find_elements(By.CLASS_NAME, "job-card-list"))
+        for page_percent in (0.3, 0.6, 1):
+            self.scroll_class_name_element_to_page_percent(job_listing_class_name, page_percent)
+            self.focus()
+            card_count = len(
+                self.wait_for_more_elements(card_count, name="job-card-list", base=job_listing)
+            )
 
         job_results = []
         for job_card in self.wait_for_all_elements_to_load(name="job-card-list", base=job_listing):
             job = self.scrape_job_card(job_card)
             job_results.append(job)
+            if on_job is not None:
+                on_job(job)
         return job_results
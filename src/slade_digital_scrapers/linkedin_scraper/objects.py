@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from time import sleep
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver import Chrome
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -79,6 +80,12 @@ class Scraper:
     driver: Chrome = None
     WAIT_FOR_ELEMENT_TIMEOUT = 5
     TOP_CARD = "pv-top-card"
+    # Fixed scripts; values are passed as arguments so the source never changes
+    SCROLL_WINDOW_JS = "window.scrollTo(0, Math.ceil(document.body.scrollHeight * arguments[0]));"
+    SCROLL_ELEMENT_JS = (
+        "const elem = document.getElementsByClassName(arguments[0])[0]; "
+        "elem.scrollTo(0, elem.scrollHeight * arguments[1]);"
+    )
 
     @staticmethod
     def wait(duration):
@@ -114,6 +121,25 @@ class Scraper:
             EC.presence_of_all_elements_located((by, name))
         )
 
+    def wait_for_more_elements(
+        self, previous_count, by=By.CLASS_NAME, name="pv-top-card", base=None
+    ):
+        """
+        Wait until more than `previous_count` elements match (e.g. after a scroll
+        triggered lazy loading) and return them; on timeout return what is there.
+        """
+
+        base = base or self.driver
+
+        def grew(driver):
+            elems = driver.find_elements(by, name)
+            return elems if len(elems) > previous_count else False
+
+        try:
+            return WebDriverWait(base, self.WAIT_FOR_ELEMENT_TIMEOUT).until(grew)
+        except TimeoutException:
+            return base.find_elements(by, name)
+
     def is_signed_in(self):
         """Best-effort check that a LinkedIn nav element is visible."""
 
@@ -130,52 +156,34 @@ class Scraper:
     def scroll_to_half(self):
         """Scroll the page to roughly the halfway point."""
 
-        self.driver.execute_script(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
-        )
+        self.driver.execute_script(self.SCROLL_WINDOW_JS, 0.5)
 
     def scroll_to_bottom(self):
         """Scroll to the bottom of the current page."""
 
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        self.driver.execute_script(self.SCROLL_WINDOW_JS, 1)
 
     def scroll_class_name_element_to_page_percent(self, class_name: str, page_percent: float):
         """Scroll a matching element to a given percentage of its height."""
 
-        self.driver.execute_script(
-            f'elem = document.getElementsByClassName("{class_name}")[0]; '
-            f"elem.scrollTo(0, elem.scrollHeight*{str(page_percent)});"
-        )
+        self.driver.execute_script(self.SCROLL_ELEMENT_JS, class_name, page_percent)
 
     def __find_element_by_class_name__(self, class_name):
         """Return True if an element with the class name exists."""
 
-        try:
-            self.driver.find_element(By.CLASS_NAME, class_name)
-            return True
-        except Exception:
-            pass
-        return False
+        # find_elements returns [] instead of raising, so a miss costs no exception
+        return bool(self.driver.find_elements(By.CLASS_NAME, class_name))
 
     def __find_element_by_xpath__(self, tag_name):
         """Return True if an element matching the xpath exists."""
 
-        try:
-            self.driver.find_element(By.XPATH, tag_name)
-            return True
-        except Exception:
-            pass
-        return False
+        return bool(self.driver.find_elements(By.XPATH, tag_name))
 
     def __find_enabled_element_by_xpath__(self, tag_name):
         """Return True if the first matched xpath element is enabled."""
 
-        try:
-            elem = self.driver.find_element(By.XPATH, tag_name)
-            return elem.is_enabled()
-        except Exception:
-            pass
-        return False
+        elems = self.driver.find_elements(By.XPATH, tag_name)
+        return bool(elems) and elems[0].is_enabled()
 
     @classmethod
     def __find_first_available_element__(cls, *args):
@@ -364,7 +364,8 @@ class Person(Scraper):
             )
         )
         self.focus()
-        self.wait(5)
+        # The name/location panel renders after the top card
+        self.wait_for_element_to_load(By.XPATH, "//*[@class='mt2 relative']")
 
         # get name and location
         self.get_name_and_location()
@@ -0,0 +1,43 @@
+"""Shared pytest fixtures for the database tests."""
+
+import contextlib
+import psycopg2
+import pytest
+
+from slade_digital_scrapers.infrastructure.database.connection import db_connection
+
+
+@pytest.fixture(scope="session")
+def db_session_conn():
+    """
+    One pooled connection for the whole test session.
+
+    Tests write on its open transaction, which is rolled back at the end so
+    test rows never persist. Skips the dependent tests when no database is reachable.
+    """
+    with contextlib.ExitStack() as stack:
+        try:
+            conn = stack.enter_context(db_connection())
+        except psycopg2.OperationalError as e:
+            pytest.skip(f"Database unavailable: {e}")
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+
+
+@pytest.fixture
+def db_conn(db_session_conn):
+    """
+    The session connection, wrapped in a savepoint for one test.
+
+    Rolling back to the savepoint undoes the test's writes and clears an aborted
+    transaction, so a database error fails only the test that caused it.
+    """
+    with db_session_conn.cursor() as cursor:
+        cursor.execute("SAVEPOINT test_case")
+    try:
+        yield db_session_conn
+    finally:
+        with db_session_conn.cursor() as cursor:
+            cursor.execute("ROLLBACK TO SAVEPOINT test_case")
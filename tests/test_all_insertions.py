@@ -1,12 +1,10 @@
 """Test script to run both entity and scraper history insertion tests."""
 
+import logging
 import sys
 import importlib.util
 from pathlib import Path
 
-# Add the src directory to the path so we can import our modules
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
 tests_dir = Path(__file__).parent
 
 # Import test functions from other test files
@@ -23,7 +21,7 @@ test_scraper_history_module = importlib.util.module_from_spec(spec2)
 spec2.loader.exec_module(test_scraper_history_module)
 
 test_entity_insertion = test_entities_module.test_entity_insertion
-test_scraper_history_insertion = test_scraper_history_module.test_scraper_history_insertion
+run_scraper_history_insertion = test_scraper_history_module.run_scraper_history_insertion
 
 
 def run_all_tests():
@@ -36,7 +34,7 @@ def run_all_tests():
     
     # Test scraper history first (simpler)
     print("\n" + "─" * 60)
-    results.append(("Scraper History", test_scraper_history_insertion()))
+    results.append(("Scraper History", run_scraper_history_insertion()))
     
     # Test entities
     print("\n" + "─" * 60)
@@ -62,6 +60,7 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     test_success = run_all_tests()
     sys.exit(0 if test_success else 1)
 
@@ -0,0 +1,34 @@
+"""Tests for the cached connection pools."""
+
+import asyncio
+import pytest
+
+from slade_digital_scrapers.infrastructure.database import connection
+
+
+def test_get_pool_rejects_different_arguments(db_session_conn):
+    """The cached pool is returned for matching arguments and never silently swapped."""
+    pool = connection.get_pool()
+    dsn, maxconn = connection._POOL_ARGS
+
+    assert connection.get_pool(dsn=dsn, maxconn=maxconn) is pool
+    with pytest.raises(ValueError, match="close_pool"):
+        connection.get_pool(maxconn=maxconn + 1)
+    with pytest.raises(ValueError, match="close_pool"):
+        connection.get_pool(dsn=dsn + "?application_name=other")
+
+
+def test_get_async_pool_rejects_different_arguments(db_session_conn):
+    """The asyncpg pool follows the same rule as the psycopg2 one."""
+
+    async def run():
+        try:
+            pool = await connection.get_async_pool()
+            dsn, maxconn = connection._ASYNC_POOL_ARGS
+            assert await connection.get_async_pool(dsn=dsn, maxconn=maxconn) is pool
+            with pytest.raises(ValueError, match="close_async_pool"):
+                await connection.get_async_pool(maxconn=maxconn + 1)
+        finally:
+            await connection.close_async_pool()
+
+    asyncio.run(run())
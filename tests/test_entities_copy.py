@@ -0,0 +1,123 @@
+"""Tests for the COPY staging path of the `entities` repository."""
+
+import pytest
+
+from slade_digital_scrapers.infrastructure.models.entities.repository import (
+    COPY_THRESHOLD,
+    ENTITY_COLUMNS,
+    _copy_field,
+    _to_copy_buffer,
+    _to_row,
+    upsert_entities,
+)
+
+PLACE_PREFIX = "test_copy_place_"
+NAME_PREFIX = "test_copy_"
+
+# Values that need escaping in COPY text format or in a text[] literal
+AWKWARD_RECORD = {
+    "name": "Tab\there, newline\nthere, CR\rand back\\slash",
+    "address": "\\N is not NULL here",
+    "rating": "4",
+    "reviews_count": 12,
+    "categories": ['Café', 'say "hi"', "back\\slash", "a,b", "{braces}", " padded "],
+    "website": "https://example.com/?a=1&b=2",
+    "phone": None,
+    "link": "https://www.google.com/maps/place/x",
+}
+
+
+def _entity(n, **fields):
+    """A minimal scraper payload with a test-scoped name and place_id."""
+    return {"name": f"{NAME_PREFIX}{n}", "place_id": f"{PLACE_PREFIX}{n}", **fields}
+
+
+def _stored(conn, where="place_id LIKE %s", params=(PLACE_PREFIX + "%",)):
+    """Read the test's entities back, keyed by place_id."""
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f"SELECT {', '.join(ENTITY_COLUMNS)} FROM entities WHERE {where}", params
+        )
+        return [dict(zip(ENTITY_COLUMNS, row)) for row in cursor.fetchall()]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, "\\N"),
+        (42, "42"),
+        ("plain", "plain"),
+        ("a\tb\nc\rd", "a\\tb\\nc\\rd"),
+        ("back\\slash", "back\\\\slash"),
+        ("\\N", "\\\\N"),
+    ],
+)
+def test_copy_field_escapes_text_format(value, expected):
+    """NULL is `\\N`; backslashes and the row/column separators are escaped."""
+    assert _copy_field(value) == expected
+
+
+def test_copy_field_renders_arrays():
+    """Array elements are quoted, then the literal is escaped like any text field."""
+    # Literal: {"say \"hi\"","back\\slash","a,b"}; COPY doubles each backslash
+    assert _copy_field(['say "hi"', "back\\slash", "a,b"]) == (
+        '{"say \\\\"hi\\\\"","back\\\\\\\\slash","a,b"}'
+    )
+
+
+def test_to_copy_buffer_writes_one_line_per_row():
+    """Fields are tab separated and every row ends with a newline."""
+    buffer = _to_copy_buffer([("a", None, 1), ("b\tc", ["x"], None)])
+    assert buffer.read() == 'a\t\\N\t1\nb\\tc\t{"x"}\t\\N\n'
+
+
+def test_copy_path_round_trips_values(db_conn):
+    """A COPY-sized batch stores every field exactly as the row builder produced it."""
+    records = [_entity(n) for n in range(COPY_THRESHOLD)]
+    records.append(_entity("awkward", **AWKWARD_RECORD))
+
+    assert upsert_entities(records, conn=db_conn) == len(records)
+
+    stored = {row["place_id"]: row for row in _stored(db_conn)}
+    assert len(stored) == len(records)
+    for record in (records[0], records[-1]):
+        assert stored[record["place_id"]] == dict(zip(ENTITY_COLUMNS, _to_row(record)))
+
+
+@pytest.mark.parametrize("size", [10, COPY_THRESHOLD + 10], ids=["row_by_row", "copy"])
+def test_repeated_place_id_keeps_last_record(db_conn, size):
+    """Both paths keep the last record for a repeated place_id."""
+    records = [_entity(n) for n in range(size)]
+    records.append(_entity(3, name=f"{NAME_PREFIX}3_updated", reviews_count=7))
+
+    upsert_entities(records, conn=db_conn)
+
+    stored = {row["place_id"]: row for row in _stored(db_conn)}
+    assert len(stored) == size
+    assert stored[f"{PLACE_PREFIX}3"]["name"] == f"{NAME_PREFIX}3_updated"
+    assert stored[f"{PLACE_PREFIX}3"]["review_count"] == 7
+
+
+def test_copy_path_keeps_every_record_without_place_id(db_conn):
+    """Rows without a place_id never conflict, so none of them are merged away."""
+    records = [_entity(n) for n in range(COPY_THRESHOLD)]
+    records += [{"name": f"{NAME_PREFIX}null_{n}"} for n in range(3)]
+
+    upsert_entities(records, conn=db_conn)
+
+    unplaced = _stored(
+        db_conn, where="place_id IS NULL AND name LIKE %s", params=(f"{NAME_PREFIX}null_%",)
+    )
+    assert sorted(row["name"] for row in unplaced) == [
+        f"{NAME_PREFIX}null_{n}" for n in range(3)
+    ]
+
+
+def test_copy_path_can_run_twice_in_one_transaction(db_conn):
+    """The staging table is dropped after each merge, not only at commit."""
+    upsert_entities([_entity(n) for n in range(COPY_THRESHOLD)], conn=db_conn)
+    upsert_entities(
+        [_entity(n, reviews_count=1) for n in range(COPY_THRESHOLD)], conn=db_conn
+    )
+
+    assert {row["review_count"] for row in _stored(db_conn)} == {1}
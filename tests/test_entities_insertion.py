@@ -1,21 +1,21 @@
 """Test script for inserting entity records into the database."""
 
-import json
+import logging
 import sys
 from pathlib import Path
-
-# Add the src directory to the path so we can import our modules
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
+import orjson
 
 from slade_digital_scrapers.infrastructure.models.entities.repository import upsert_entities
 from slade_digital_scrapers.infrastructure.database.schema import test_connection
 
+project_root = Path(__file__).parent.parent
+logger = logging.getLogger(__name__)
+
 
 def load_test_data(json_path: str) -> list[dict]:
     """Load entity data from the response JSON file."""
-    with open(json_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(json_path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def test_entity_insertion():
@@ -65,8 +65,7 @@ def test_entity_insertion():
         print(f"   (This includes both new inserts and updates to existing records)")
     except Exception as e:
         print(f"❌ Failed to insert entities: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Entity upsert failed")
         return False
     
     print("\n" + "=" * 60)
@@ -76,6 +75,7 @@ def test_entity_insertion():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     success = test_entity_insertion()
     sys.exit(0 if success else 1)
 
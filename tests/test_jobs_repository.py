@@ -0,0 +1,137 @@
+"""Tests for the row coercion and batching in the `jobs` repository."""
+
+import asyncio
+import datetime as dt
+import pytest
+
+from slade_digital_scrapers.infrastructure.models.jobs import repository as jobs_repository
+from slade_digital_scrapers.infrastructure.models.jobs.repository import (
+    JOB_COLUMNS,
+    _coerce_count,
+    _coerce_date,
+    _to_row,
+    drain_jobs,
+    store_job_search,
+)
+
+
+class FakeJob:
+    """Stand-in for `linkedin_scraper.jobs.Job`; only `to_dict` is used."""
+
+    def __init__(self, n):
+        self.n = n
+
+    def to_dict(self):
+        return {"linkedin_url": f"https://www.linkedin.com/jobs/view/{self.n}", "job_title": "Engineer"}
+
+
+class FakeJobSearch:
+    """Stand-in for `JobSearch` that reports `count` jobs, then optionally fails."""
+
+    def __init__(self, count, fail=False):
+        self.count = count
+        self.fail = fail
+
+    def search(self, search_term, on_job=None):
+        jobs = [FakeJob(n) for n in range(self.count)]
+        for job in jobs:
+            on_job(job)
+        if self.fail:
+            raise RuntimeError("driver crashed")
+        return jobs
+
+
+@pytest.fixture
+def copied_batches(monkeypatch):
+    """Record the batches `drain_jobs` would COPY instead of writing them."""
+    batches = []
+
+    async def fake_copy_jobs(records):
+        batches.append(list(records))
+        return len(batches[-1])
+
+    monkeypatch.setattr(jobs_repository, "copy_jobs", fake_copy_jobs)
+    return batches
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (dt.datetime(2025, 3, 4, 12, 30), dt.date(2025, 3, 4)),
+        (dt.date(2025, 3, 4), dt.date(2025, 3, 4)),
+        ("2025-03-04T12:30:00Z", dt.date(2025, 3, 4)),
+        ("2 weeks ago", None),
+        (None, None),
+    ],
+)
+def test_coerce_date(value, expected):
+    """Dates and ISO strings are kept as dates; relative dates are dropped."""
+    assert _coerce_date(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (42, 42),
+        (None, None),
+        ("1,234 applicants", 1234),
+        ("Over 200 applicants", 200),
+        ("Be an early applicant", None),
+    ],
+)
+def test_coerce_count(value, expected):
+    """Applicant counts are read from the first number in the text."""
+    assert _coerce_count(value) == expected
+
+
+def test_to_row_follows_column_order():
+    """Rows line up with JOB_COLUMNS and prefer `applicant_count` over `application_count`."""
+    row = _to_row(
+        {
+            "linkedin_url": "https://www.linkedin.com/jobs/view/1",
+            "job_title": "Engineer",
+            "posted_date": "2025-03-04",
+            "applicant_count": "57 applicants",
+            "application_count": 3,
+        }
+    )
+    assert len(row) == len(JOB_COLUMNS)
+    assert dict(zip(JOB_COLUMNS, row)) == {
+        "linkedin_url": "https://www.linkedin.com/jobs/view/1",
+        "job_title": "Engineer",
+        "company": None,
+        "company_linkedin_url": None,
+        "location": None,
+        "posted_date": dt.date(2025, 3, 4),
+        "application_count": 57,
+        "job_description": None,
+        "benefits": None,
+    }
+
+
+def test_drain_jobs_copies_full_batches_then_the_rest(copied_batches):
+    """Jobs are copied in `batch_size` chunks, with the remainder flushed at the end."""
+
+    async def run():
+        queue = asyncio.Queue()
+        for n in range(5):
+            queue.put_nowait(FakeJob(n).to_dict())
+        queue.put_nowait(None)
+        return await drain_jobs(queue, batch_size=2)
+
+    assert asyncio.run(run()) == 5
+    assert [len(batch) for batch in copied_batches] == [2, 2, 1]
+
+
+def test_store_job_search_streams_jobs_to_the_writer(copied_batches):
+    """Every job the search reports reaches the writer."""
+    written = asyncio.run(store_job_search(FakeJobSearch(3), "engineer", batch_size=2))
+    assert written == 3
+    assert sum(len(batch) for batch in copied_batches) == 3
+
+
+def test_store_job_search_releases_the_writer_on_failure(copied_batches):
+    """A failing search still flushes the jobs reported so far, then raises."""
+    with pytest.raises(RuntimeError):
+        asyncio.run(store_job_search(FakeJobSearch(3, fail=True), "engineer", batch_size=10))
+    assert [len(batch) for batch in copied_batches] == [3]
@@ -0,0 +1,39 @@
+"""Tests for handing browser cookies to the aiohttp fetch path."""
+
+import asyncio
+
+from yarl import URL
+
+from slade_digital_scrapers.gmaps_scraper.scraper import _cookie_jar_from_browser
+
+PLACE_URL = URL("https://www.google.com/maps/place/Some+Place")
+
+
+def _cookie_header(cookies, url):
+    """Render the Cookie header aiohttp's ClientRequest would send to `url`."""
+
+    async def render():
+        # aiohttp cookie jars must be created inside a running event loop
+        jar = _cookie_jar_from_browser(cookies)
+        return jar.filter_cookies(url).output(header="", sep=";").strip()
+
+    return asyncio.run(render())
+
+
+def test_cookie_values_are_sent_unquoted():
+    """Values containing `=` (Google's NID is always "511=...") are not quoted."""
+    cookies = [
+        {"name": "NID", "value": "511=abc", "domain": ".google.com", "path": "/"},
+        {"name": "SOCS", "value": "CAISNQgD", "domain": ".google.com", "path": "/"},
+    ]
+    assert _cookie_header(cookies, PLACE_URL) == "NID=511=abc; SOCS=CAISNQgD"
+
+
+def test_cookies_follow_domain_and_path():
+    """Cookies only go to the domain and path the browser scoped them to."""
+    cookies = [
+        {"name": "NID", "value": "511=abc", "domain": ".google.com", "path": "/"},
+        {"name": "OTHER", "value": "1", "domain": ".example.com", "path": "/"},
+        {"name": "SEARCH", "value": "2", "domain": ".google.com", "path": "/search"},
+    ]
+    assert _cookie_header(cookies, PLACE_URL) == "NID=511=abc"
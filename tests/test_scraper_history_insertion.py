@@ -1,109 +1,188 @@
 """Test script for inserting scraper history records into the database."""
 
+import logging
 import sys
-from pathlib import Path
-
-# Add the src directory to the path so we can import our modules
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
+import pytest
 
 from slade_digital_scrapers.infrastructure.models.scraper_hisotry.repository import (
     upsert_scrape_history,
+    upsert_scrape_history_returning,
     get_scrape_history,
 )
 from slade_digital_scrapers.infrastructure.models.scraper_hisotry.schema import ScrapeHistoryContract
-from slade_digital_scrapers.infrastructure.database.schema import test_connection
+import psycopg2
+from slade_digital_scrapers.infrastructure.database.connection import db_connection
+from slade_digital_scrapers.infrastructure.database.schema import (
+    test_connection as check_connection,
+)
+
+logger = logging.getLogger(__name__)
+
+# One formatted block per fetched row
+ROW_TMPL = (
+    "   - ID: {id}\n"
+    "     Source: {source}\n"
+    "     Search Key: {search_key}\n"
+    "     Location Key: {location_key}\n"
+    "     Results Scraped: {results_scraped}\n"
+    "     Created At: {created_at}\n"
+)
+
+BASE_NYC_RECORD = ScrapeHistoryContract(
+    source="gmaps_insurance_nyc_test",
+    search_key="insurance agencies in New York",
+    location_key="New York, NY",
+    results_scraped=20,
+)
+
+TEST_RECORDS = [
+    BASE_NYC_RECORD,
+    ScrapeHistoryContract(
+        source="gmaps_restaurants_la_test",
+        search_key="restaurants in Los Angeles",
+        location_key="Los Angeles, CA",
+        results_scraped=50,
+    ),
+    # Duplicate source to test upsert, with an updated count
+    BASE_NYC_RECORD.model_copy(update={"results_scraped": 25}),
+]
+
+HISTORY_CASES = [
+    pytest.param(TEST_RECORDS[:1], id="single"),
+    pytest.param(TEST_RECORDS, id="duplicate-source"),
+]
+
+
+def _dedupe(records):
+    """Repository dicts for `records`, one per source; the last record for a source wins."""
+    return list({r["source"]: r for r in (rec.to_repository_dict() for rec in records)}.values())
+
+
+def test_connection_ok(db_conn):
+    """The shared connection answers queries."""
+    assert check_connection(db_conn)
+
 
+@pytest.mark.parametrize("records", HISTORY_CASES)
+def test_upsert_roundtrip(db_conn, records):
+    """The table holds one row per source with the last record's values."""
+    upsert_scrape_history([record.to_repository_dict() for record in records], conn=db_conn)
+    expected = _dedupe(records)
+    with db_conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT source, search_key, location_key, results_scraped "
+            "FROM scrape_history WHERE source = ANY(%s)",
+            ([r["source"] for r in expected],),
+        )
+        stored = {row[0]: row for row in cursor.fetchall()}
+    assert stored == {
+        r["source"]: (r["source"], r["search_key"], r["location_key"], r["results_scraped"])
+        for r in expected
+    }
 
-def test_scraper_history_insertion():
-    """Test inserting scraper history records."""
-    print("=" * 60)
-    print("Testing Scraper History Insertion")
-    print("=" * 60)
+
+@pytest.mark.parametrize("records", HISTORY_CASES)
+def test_fetch_roundtrip(db_conn, records):
+    """Fetching by source returns the last upserted count for each source."""
+    records_dict = _dedupe(records)
+    upsert_scrape_history(records_dict, conn=db_conn)
+    fetched = get_scrape_history(sources={r["source"] for r in records_dict}, conn=db_conn)
+    assert {r["source"]: r["results_scraped"] for r in fetched} == {
+        r["source"]: r["results_scraped"] for r in records_dict
+    }
+
+
+@pytest.mark.parametrize("records", HISTORY_CASES)
+def test_upsert_returning(db_conn, records):
+    """The upsert hands back the stored row for each source without a fetch."""
+    records_dict = _dedupe(records)
+    returned = upsert_scrape_history_returning(
+        [record.to_repository_dict() for record in records], conn=db_conn
+    )
+    assert {r["source"]: r["results_scraped"] for r in returned} == {
+        r["source"]: r["results_scraped"] for r in records_dict
+    }
+    assert all(r["id"] is not None for r in returned)
+
+
+def run_scraper_history_insertion():
+    """Run the scraper history insertion check as a script, printing each step."""
+    # Output is collected and written once instead of one write per line
+    buf: list[str] = []
+    # One pooled connection and transaction serve the whole check
+    try:
+        with db_connection() as conn:
+            success = _run_history_check(conn, buf)
+            if success:
+                conn.commit()
+            else:
+                conn.rollback()
+    except psycopg2.Error as e:
+        buf.append(f"❌ Database connection failed: {e}")
+        return False
+    finally:
+        _flush(buf)
+    return success
+
+
+def _flush(buf):
+    """Write the buffered lines to stdout in one call and clear the buffer."""
+    if buf:
+        sys.stdout.write("\n".join(buf) + "\n")
+        buf.clear()
+
+
+def _run_history_check(conn, buf):
+    """Run the connection check, upsert and fetch on `conn`, appending output to `buf`."""
+    buf.append("=" * 60)
+    buf.append("Testing Scraper History Insertion")
+    buf.append("=" * 60)
     
     # Test database connection first
-    print("\n1. Testing database connection...")
-    if not test_connection():
-        print("❌ Database connection failed. Please check your configuration.")
+    buf.append("\n1. Testing database connection...")
+    if not check_connection(conn):
+        buf.append("❌ Database connection failed. Please check your configuration.")
         return False
-    print("✅ Database connection successful!")
+    buf.append("✅ Database connection successful!")
     
     # Create test records
-    print("\n2. Creating test scraper history records...")
-    test_records = [
-        ScrapeHistoryContract(
-            source="gmaps_insurance_nyc_test",
-            search_key="insurance agencies in New York",
-            location_key="New York, NY",
-            results_scraped=20,
-        ),
-        ScrapeHistoryContract(
-            source="gmaps_restaurants_la_test",
-            search_key="restaurants in Los Angeles",
-            location_key="Los Angeles, CA",
-            results_scraped=50,
-        ),
-        ScrapeHistoryContract(
-            source="gmaps_insurance_nyc_test",  # Duplicate source to test upsert
-            search_key="insurance agencies in New York",
-            location_key="New York, NY",
-            results_scraped=25,  # Updated count
-        ),
-    ]
+    buf.append("\n2. Creating test scraper history records...")
+    test_records = TEST_RECORDS
     
-    print(f"   Created {len(test_records)} test records:")
+    buf.append(f"   Created {len(test_records)} test records:")
     for record in test_records:
-        print(f"   - Source: {record.source}")
-        print(f"     Search: {record.search_key}")
-        print(f"     Location: {record.location_key}")
-        print(f"     Results: {record.results_scraped}")
+        buf.append(f"   - Source: {record.source}")
+        buf.append(f"     Search: {record.search_key}")
+        buf.append(f"     Location: {record.location_key}")
+        buf.append(f"     Results: {record.results_scraped}")
     
     # Insert records
-    print(f"\n3. Inserting scraper history records into database...")
+    buf.append(f"\n3. Inserting scraper history records into database...")
     try:
-        records_dict = [record.to_repository_dict() for record in test_records]
-        rows_inserted = upsert_scrape_history(records_dict)
-        print(f"✅ Successfully processed {rows_inserted} records")
-        print(f"   (Note: Duplicate sources in the same batch are deduplicated automatically)")
+        # Dedupe by source client-side; the last record for a source wins
+        records_dict = _dedupe(test_records)
+        # The upsert returns the stored rows, so no follow-up fetch is needed
+        matching_records = upsert_scrape_history_returning(records_dict, conn=conn)
+        buf.append(f"✅ Successfully processed {len(matching_records)} records")
+        buf.append(f"   (Note: {len(test_records) - len(records_dict)} duplicate source(s) were merged before the upsert; the last one wins)")
     except Exception as e:
-        print(f"❌ Failed to insert scraper history: {e}")
-        import traceback
-        traceback.print_exc()
+        buf.append(f"❌ Failed to insert scraper history: {e}")
+        _flush(buf)
+        logger.exception("Scraper history upsert failed")
         return False
     
-    # Fetch and display records
-    print(f"\n4. Fetching scraper history records from database...")
-    try:
-        all_records = get_scrape_history()
-        print(f"✅ Retrieved {len(all_records)} total records from database")
-        
-        # Show the test records we just inserted
-        test_sources = {record.source for record in test_records}
-        matching_records = [r for r in all_records if r.get("source") in test_sources]
-        
-        if matching_records:
-            print(f"\n   Found {len(matching_records)} matching test records:")
-            for record in matching_records:
-                print(f"   - ID: {record.get('id')}")
-                print(f"     Source: {record.get('source')}")
-                print(f"     Search Key: {record.get('search_key')}")
-                print(f"     Location Key: {record.get('location_key')}")
-                print(f"     Results Scraped: {record.get('results_scraped')}")
-                print(f"     Created At: {record.get('created_at')}")
-                print()
-    except Exception as e:
-        print(f"❌ Failed to fetch scraper history: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Display the rows returned by the upsert
+    buf.append(f"\n4. Upserted scraper history records:")
+    buf.extend(ROW_TMPL.format_map(record) for record in matching_records)
     
-    print("=" * 60)
-    print("✅ Scraper history insertion test completed successfully!")
-    print("=" * 60)
+    buf.append("=" * 60)
+    buf.append("✅ Scraper history insertion test completed successfully!")
+    buf.append("=" * 60)
     return True
 
 
 if __name__ == "__main__":
-    success = test_scraper_history_insertion()
+    logging.basicConfig(level=logging.INFO)
+    success = run_scraper_history_insertion()
     sys.exit(0 if success else 1)
 